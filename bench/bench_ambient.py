@@ -0,0 +1,89 @@
+"""
+Benchmark: 5,000 pitchmen (user-019).
+
+5,000 `Pitchman` scripts in 500 rooms, players in 10 of them. Times one pass
+of the shared ambient ticker against the old `at_repeat` of every script (one
+timer per script, searching the room for characters and sending the message
+whether anyone listens or not).
+
+"""
+
+import random
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object, create_script  # noqa: E402
+from world import ambient  # noqa: E402
+
+PITCHMEN = 5000
+ROOMS = 500
+OCCUPIED_ROOMS = 10
+TICKS = 20
+
+
+def old_at_repeat(script):
+    """
+    `Pitchman.at_repeat` before the ambient scheduler.
+
+    """
+    if random.random() > script.frequency:
+        return
+    messages = script.messages
+    weights = script.weights
+    if len(weights) < 1 or len(weights) != len(messages):
+        message = random.choices(messages)[0]
+    else:
+        message = random.choices(messages, weights)[0]
+    chars = script.obj.search("", typeclass="typeclasses.characters.Character", quiet=True)
+    if len(chars) > 0:
+        char = random.choices(chars)[0].get_display_name()
+    else:
+        char = "Abenteurer"
+    message = message.format(obj=script.obj.get_display_name(), char=char)
+    script.obj.location.msg_contents(message)
+
+
+def main():
+    with benchutil.rollback():
+        rooms = [
+            create_object("typeclasses.rooms.Room", key=f"Gasse{num}", nohome=True)
+            for num in range(ROOMS)
+        ]
+        scripts = []
+        for num in range(PITCHMEN):
+            barker = create_object(
+                "typeclasses.characters.NPC", key=f"Händler{num}", location=rooms[num % ROOMS]
+            )
+            scripts.append(create_script("typeclasses.scripts.Pitchman", obj=barker))
+        for room in rooms[:OCCUPIED_ROOMS]:
+            player = create_object("typeclasses.characters.Character", key="Spieler", location=room)
+            # stands in for a connected session
+            room.get_occupants().add(player)
+
+        interval = scripts[0].tick_interval
+
+        def per_script_timers():
+            for script in scripts:
+                old_at_repeat(script)
+
+        def shared_ticker():
+            ambient._tick(bucket=interval)
+
+        old = benchutil.timed(per_script_timers, TICKS)
+        new = benchutil.timed(shared_ticker, TICKS)
+        timers = len(ambient._BUCKETS)
+
+    benchutil.report(
+        f"ambient scheduler: {PITCHMEN} pitchmen, {OCCUPIED_ROOMS}/{ROOMS} rooms occupied",
+        [
+            ("reactor timers, one per script (old)", PITCHMEN),
+            ("reactor timers, ambient buckets", timers),
+            (f"{TICKS} ticks, old at_repeat of every script", old),
+            (f"{TICKS} ticks, shared ambient ticker", new),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: 1,000 recipes against a 500-item inventory (user-022).
+
+Times `RecipeIndex.craftable` against testing every recipe (brute force, with
+the materials counted only once) and counts the queries of a `craftable` call.
+
+"""
+
+import random
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object  # noqa: E402
+from world.crafting import RecipeIndex, collect_tools, count_materials  # noqa: E402
+from world.enums import CraftingCategory  # noqa: E402
+
+RECIPES = 1000
+ITEMS = 500
+MATERIALS = 200
+REPEAT = 20
+
+
+def main():
+    rng = random.Random(42)
+    materials = [f"material{num}" for num in range(MATERIALS)]
+    recipes = [
+        {
+            "key": f"Rezept{num}",
+            "materials": {
+                material: rng.randint(1, 3) for material in rng.sample(materials, rng.randint(1, 4))
+            },
+            "result": "feuerholz",
+        }
+        for num in range(RECIPES)
+    ]
+    index = RecipeIndex(recipes)
+
+    with benchutil.rollback():
+        crafter = create_object("typeclasses.characters.Character", key="Handwerker", nohome=True)
+        for num in range(ITEMS):
+            create_object(
+                "typeclasses.items.Item",
+                key=f"Material{num}",
+                location=crafter,
+                tags=[(rng.choice(materials), CraftingCategory.MATERIAL.value)],
+            )
+        inventory = list(crafter.contents)
+
+        def brute_force():
+            counts = count_materials(inventory)
+            tools = collect_tools(inventory)
+            return [
+                recipe
+                for recipe in recipes
+                if all(counts[material] >= needed for material, needed in recipe["materials"].items())
+                and tools.issuperset(recipe.get("tools", ()))
+            ]
+
+        craftable = len(index.craftable(inventory))
+        queries = benchutil.count_queries(lambda: index.craftable(inventory))
+        old = benchutil.timed(brute_force, REPEAT)
+        new = benchutil.timed(lambda: index.craftable(inventory), REPEAT)
+
+    benchutil.report(
+        f"crafting: {RECIPES} recipes, {ITEMS} items",
+        [
+            ("craftable recipes", craftable),
+            ("queries of craftable", queries),
+            (f"{REPEAT} x testing every recipe", old),
+            (f"{REPEAT} x RecipeIndex.craftable", new),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
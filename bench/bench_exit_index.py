@@ -0,0 +1,54 @@
+"""
+Benchmark: moving through a crowded room (user-003).
+
+Times the exit lookup of `announce_move_from` in a room full of dropped items:
+walking `contents` (the old path) against the destination index
+(`get_exits_to`), and full moves out of the room and back.
+
+"""
+
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object  # noqa: E402
+
+ITEMS = 2000
+LOOKUPS = 1000
+MOVES = 200
+
+
+def main():
+    with benchutil.rollback():
+        square = create_object("typeclasses.rooms.Room", key="Marktplatz", nohome=True)
+        alley = create_object("typeclasses.rooms.Room", key="Gasse", nohome=True)
+        create_object("typeclasses.exits.Exit", key="Gasse", location=square, destination=alley)
+        create_object("typeclasses.exits.Exit", key="Markt", location=alley, destination=square)
+        walker = create_object("typeclasses.characters.Character", key="Wanderer", location=square)
+        for num in range(ITEMS):
+            create_object("typeclasses.items.Item", key=f"Kram{num}", location=square)
+
+        def scan_contents():
+            return [obj for obj in square.contents if obj.destination == alley]
+
+        scanned = benchutil.timed(scan_contents, LOOKUPS)
+        indexed = benchutil.timed(lambda: square.get_exits_to(alley), LOOKUPS)
+
+        def walk():
+            walker.move_to(alley, quiet=False)
+            walker.move_to(square, quiet=False)
+
+        moves = benchutil.timed(walk, MOVES // 2)
+
+    benchutil.report(
+        f"exit index: room with {ITEMS} items",
+        [
+            (f"{LOOKUPS} exit lookups, walking contents", scanned),
+            (f"{LOOKUPS} exit lookups, get_exits_to", indexed),
+            (f"{MOVES} moves in and out of the room", moves),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: 1M health bar renders (user-016).
+
+Times `display_meter` with the render cache against the same function without
+it (the old path, every bar assembled again), and `display_meters` for a party.
+Needs no database.
+
+"""
+
+import random
+import benchutil
+
+benchutil.add_game_dir()
+
+from world import health_bar  # noqa: E402
+
+RENDERS = 1_000_000
+PARTY = 6
+
+
+def main():
+    rng = random.Random(42)
+    # prompt-like values: hp of a few characters going up and down
+    values = [(rng.randint(0, 120), 120) for _ in range(1000)]
+
+    def renders():
+        display_meter = health_bar.display_meter
+        for num in range(RENDERS):
+            cur_value, max_value = values[num % len(values)]
+            display_meter(cur_value, max_value)
+
+    cached_render = health_bar._render_meter
+    health_bar._render_meter = cached_render.__wrapped__
+    try:
+        uncached = benchutil.timed(renders)
+    finally:
+        health_bar._render_meter = cached_render
+    cached = benchutil.timed(renders)
+
+    party = values[:PARTY]
+    batches = benchutil.timed(lambda: health_bar.display_meters(party), RENDERS // PARTY)
+
+    benchutil.report(
+        "health bar",
+        [
+            (f"{RENDERS} display_meter, no render cache (old)", uncached),
+            (f"{RENDERS} display_meter, render cache", cached),
+            (f"{RENDERS // PARTY} display_meters for {PARTY} characters", batches),
+            ("render cache", health_bar._render_meter.cache_info()),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: 10k container access checks (user-013).
+
+Times `access` of 50 chests through Evennia's lock handler (the old path)
+against `Ownable.access`: the owner fast path, the compiled lock of an unowned
+chest and a denied check of a stranger.
+
+"""
+
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object  # noqa: E402
+from typeclasses.objects import ObjectParent  # noqa: E402
+
+CHESTS = 50
+CHECKS = 10_000
+
+
+def main():
+    with benchutil.rollback():
+        room = create_object("typeclasses.rooms.Room", key="Lager", nohome=True)
+        owner = create_object("typeclasses.characters.Character", key="Besitzer", location=room)
+        stranger = create_object("typeclasses.characters.Character", key="Fremder", location=room)
+        chests = [
+            create_object("typeclasses.containers.Container", key=f"Truhe{num}", location=room)
+            for num in range(CHESTS)
+        ]
+        for chest in chests[1:]:
+            chest.set_owner(owner, owner)
+        unowned = chests[0]
+        owned = chests[1:]
+
+        def checks(accessing_obj, targets, fast):
+            for num in range(CHECKS):
+                chest = targets[num % len(targets)]
+                if fast:
+                    chest.access(accessing_obj, "look_into")
+                else:
+                    ObjectParent.access(chest, accessing_obj, "look_into")
+
+        rows = []
+        for label, accessing_obj, targets in (
+            ("owner, owned chests", owner, owned),
+            ("anyone, unowned chest", stranger, [unowned]),
+            ("stranger, owned chests (denied)", stranger, owned),
+        ):
+            slow = benchutil.timed(lambda: checks(accessing_obj, targets, False))
+            fast = benchutil.timed(lambda: checks(accessing_obj, targets, True))
+            rows.append((f"{CHECKS} checks {label}, lock handler", slow))
+            rows.append((f"{CHECKS} checks {label}, Ownable.access", fast))
+
+    benchutil.report("container lock checks", rows)
+
+
+if __name__ == "__main__":
+    main()
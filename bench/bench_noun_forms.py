@@ -0,0 +1,69 @@
+"""
+Benchmark: rendering a room with 500 items (user-001).
+
+Counts the database queries of a `look` at the room, cold (right after the
+contents changed) and warm, and times `get_numbered_name` with the cached noun
+forms against reading them from the tag and attribute handlers on every call
+(the old path).
+
+"""
+
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object  # noqa: E402
+
+ITEMS = 500
+KINDS = 50
+RENDERS = 20
+
+
+def main():
+    with benchutil.rollback():
+        room = create_object("typeclasses.rooms.Room", key="Benchmark-Raum", nohome=True)
+        looker = create_object("typeclasses.characters.Character", key="Betrachter", location=room)
+        items = []
+        for num in range(ITEMS):
+            kind = num % KINDS
+            items.append(
+                create_object(
+                    "typeclasses.items.Item",
+                    key=f"Stein{kind}",
+                    location=room,
+                    attributes=[("plural", f"Steine{kind}")],
+                    tags=[("m", "gender")],
+                )
+            )
+
+        room.at_contents_change()
+        cold_queries = benchutil.count_queries(lambda: room.return_appearance(looker))
+        warm_queries = benchutil.count_queries(lambda: room.return_appearance(looker))
+        warm_time = benchutil.timed(lambda: room.return_appearance(looker), RENDERS)
+
+        def numbered_names():
+            for obj in items:
+                obj.get_numbered_name(3, looker, case="accusative", definite_article=True)
+
+        def numbered_names_uncached():
+            for obj in items:
+                obj.ndb.noun_forms = None
+                obj.get_numbered_name(3, looker, case="accusative", definite_article=True)
+
+        cached = benchutil.timed(numbered_names, RENDERS)
+        uncached = benchutil.timed(numbered_names_uncached, RENDERS)
+
+    benchutil.report(
+        f"noun forms: room with {ITEMS} items",
+        [
+            ("queries, first look after a change", cold_queries),
+            ("queries, next look", warm_queries),
+            (f"{RENDERS} looks (warm)", warm_time),
+            (f"{RENDERS} x {ITEMS} get_numbered_name, read every call", uncached),
+            (f"{RENDERS} x {ITEMS} get_numbered_name, cached forms", cached),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
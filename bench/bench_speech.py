@@ -0,0 +1,61 @@
+"""
+Benchmark: say to 100 characters and whisper to 30 (user-008).
+
+Times `at_say` for a say in a room of 100 characters and a group whisper to 30
+of them, and building the receiver list once against once per receiver (the
+old O(n²) path of the whisper).
+
+"""
+
+import benchutil
+
+benchutil.setup()
+
+from evennia.utils.create import create_object  # noqa: E402
+
+LISTENERS = 100
+WHISPER_RECEIVERS = 30
+REPEAT = 100
+
+
+def main():
+    with benchutil.rollback():
+        room = create_object("typeclasses.rooms.Room", key="Taverne", nohome=True)
+        speaker = create_object("typeclasses.characters.Character", key="Sprecher", location=room)
+        listeners = [
+            create_object("typeclasses.characters.Character", key=f"Gast{num}", location=room)
+            for num in range(LISTENERS)
+        ]
+        receivers = listeners[:WHISPER_RECEIVERS]
+
+        say = benchutil.timed(lambda: speaker.at_say("Hallo zusammen!", msg_self=True), REPEAT)
+        whisper = benchutil.timed(
+            lambda: speaker.at_say(
+                "Psst!", msg_self=True, receivers=receivers, whisper=True
+            ),
+            REPEAT,
+        )
+
+        def receiver_list_per_receiver():
+            for _ in receivers:
+                ", ".join(recv.get_display_name(recv) for recv in receivers)
+
+        def receiver_list_once():
+            ", ".join(recv.get_display_name(recv) for recv in receivers)
+
+        per_receiver = benchutil.timed(receiver_list_per_receiver, REPEAT)
+        once = benchutil.timed(receiver_list_once, REPEAT)
+
+    benchutil.report(
+        "speech",
+        [
+            (f"{REPEAT} says to {LISTENERS} characters", say),
+            (f"{REPEAT} whispers to {WHISPER_RECEIVERS} characters", whisper),
+            (f"{REPEAT} x receiver list per receiver (old)", per_receiver),
+            (f"{REPEAT} x receiver list once", once),
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark helpers
+
+Shared setup of the standalone benchmark scripts in this folder. Run them from
+the game directory, with a migrated database:
+
+```
+    python bench/bench_noun_forms.py
+```
+
+Every script sets up Django and Evennia, works inside a transaction that is
+rolled back at the end (nothing it creates is kept), prints its results and
+appends them to `server/logs/bench_output.txt`.
+
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUTPUT_FILE = os.path.join(GAME_DIR, "server", "logs", "bench_output.txt")
+
+
+def add_game_dir():
+    """
+    Make the game modules importable (enough for benchmarks without a database).
+
+    """
+    if GAME_DIR not in sys.path:
+        sys.path.insert(0, GAME_DIR)
+
+
+def setup():
+    """
+    Set up Django and Evennia for a standalone script.
+
+    """
+    add_game_dir()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "server.conf.settings")
+    import django
+
+    django.setup()
+    import evennia
+
+    evennia._init()
+
+
+@contextmanager
+def rollback():
+    """
+    Run the benchmark in a transaction that is rolled back at the end.
+
+    """
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def timed(func, number=1):
+    """
+    Seconds it takes to call `func` `number` times.
+
+    """
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - start
+
+
+def count_queries(func):
+    """
+    Number of database queries made by calling `func` once.
+
+    """
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    with CaptureQueriesContext(connection) as context:
+        func()
+    return len(context.captured_queries)
+
+
+def report(title, rows):
+    """
+    Print results and append them to `OUTPUT_FILE`.
+
+    Args:
+        title (str): Name of the benchmark.
+        rows (list): `(label, value)` pairs. Floats are shown as milliseconds.
+
+    """
+    lines = [f"== {title} =="]
+    for label, value in rows:
+        if isinstance(value, float):
+            value = f"{value * 1000:.2f} ms"
+        lines.append(f"{label:<50} {value}")
+    text = "\n".join(lines) + "\n\n"
+    print(text, end="")
+    with open(OUTPUT_FILE, "a", encoding="utf-8") as output:
+        output.write(text)
@@ -10,6 +10,7 @@ from evennia.commands.default import (
 from evennia.utils import utils
 from evennia.utils.ansi import ANSIString
 from evennia.utils.utils import dedent, format_grid, pad
+from typeclasses.items import count_units, move_units
 
 
 # ----- GENERAL -----
@@ -88,7 +89,11 @@ class CmdInventory(general.CmdInventory):
             from evennia.utils.ansi import raw as raw_ansi
 
             table = self.styled_table(border="header")
-            for key, desc, _ in utils.group_objects_by_key_and_desc(items, caller=self.caller):
+            for key, desc, objs in utils.group_objects_by_key_and_desc(items, caller=self.caller):
+                units = count_units(objs)
+                if units != len(objs):
+                    # stacks: count units instead of objects
+                    key = objs[0].get_numbered_name(units, self.caller, return_string=True)
                 table.add_row(
                     f"{key}",
                     "{}|n".format(utils.crop(raw_ansi(desc or ""), width=50) or ""),
@@ -157,13 +162,18 @@ class CmdGet(general.CmdGet):
             if not obj.at_pre_get(caller):
                 return
 
-        moved = []
+        # check the weight before anything moves
+        if hasattr(caller, "can_carry") and not caller.can_carry(
+            min(count_units(objs), self.number or 1), objs[0]
+        ):
+            self.msg("Das ist dir zu schwer.")
+            return
+
         # attempt to move all of the objects
-        for obj in objs:
-            if obj.move_to(caller, quiet=True, move_type="get"):
-                moved.append(obj)
-                # calling at_get hook method
-                obj.at_get(caller)
+        moved = move_units(objs, self.number, caller, move_type="get")
+        for obj in moved:
+            # calling at_get hook method
+            obj.at_get(caller)
 
         if not moved:
             # none of the objects were successfully moved
@@ -171,16 +181,16 @@ class CmdGet(general.CmdGet):
             return
         else:
             obj_name = moved[0].get_numbered_name(
-                len(moved), caller, return_string=True, case="accusative"
+                count_units(moved), caller, return_string=True, case="accusative"
             )
 
-        # enumerate objects in same location as caller
-        contents = caller.location.contents
-        exclude = utils.make_iter(caller)
-        contents = [obj for obj in contents if obj not in exclude]
-
-        for receiver in contents:
-            receiver.msg(f"{caller} nimmt sich {obj_name}.")
+        # announce to everyone else in the same location as caller
+        caller.location.broadcast(
+            "{caller} nimmt sich {obj_name}.",
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "obj_name": obj_name},
+        )
 
         caller.msg(f"Du nimmst dir {obj_name}.")
 
@@ -245,12 +255,10 @@ class CmdDrop(general.CmdDrop):
                 return
 
         # do the actual dropping
-        moved = []
-        for obj in objs:
-            if obj.move_to(caller.location, quiet=True, move_type="drop"):
-                moved.append(obj)
-                # Call the object's at_drop() method.
-                obj.at_drop(caller)
+        moved = move_units(objs, self.number, caller.location, move_type="drop")
+        for obj in moved:
+            # Call the object's at_drop() method.
+            obj.at_drop(caller)
 
         if not moved:
             # none of the objects were successfully moved
@@ -258,16 +266,16 @@ class CmdDrop(general.CmdDrop):
             return
         else:
             obj_name = moved[0].get_numbered_name(
-                len(moved), caller, return_string=True, case="accusative"
+                count_units(moved), caller, return_string=True, case="accusative"
             )
 
-        # enumerate objects in same location as caller
-        contents = caller.location.contents
-        exclude = utils.make_iter(caller)
-        contents = [obj for obj in contents if obj not in exclude]
-
-        for receiver in contents:
-            receiver.msg(f"{caller} legt {obj_name} ab.")
+        # announce to everyone else in the same location as caller
+        caller.location.broadcast(
+            "{caller} legt {obj_name} ab.",
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "obj_name": obj_name},
+        )
 
         caller.msg(f"Du legst {obj_name} ab.")
 
@@ -371,7 +379,7 @@ class CmdGive(general.CmdGive):
         if not to_give:
             return
         # find the target to give to
-        target = caller.search(self.rhs)
+        target = caller.search_many([self.rhs])[0]
         if not target:
             return
 
@@ -380,7 +388,10 @@ class CmdGive(general.CmdGive):
         to_give = utils.make_iter(to_give)
 
         obj_name = to_give[0].get_numbered_name(
-            len(to_give), caller, return_string=True, case="accusative"
+            min(count_units(to_give), self.number or 1),
+            caller,
+            return_string=True,
+            case="accusative",
         )
         if target == caller:
             caller.msg(f"Du behältst {obj_name} für dich.")
@@ -392,19 +403,24 @@ class CmdGive(general.CmdGive):
             if not obj.at_pre_give(caller, target):
                 return
 
+        # check the weight before anything moves
+        if hasattr(target, "can_carry") and not target.can_carry(
+            min(count_units(to_give), self.number or 1), to_give[0]
+        ):
+            caller.msg(f"{target.get_display_name(caller)} kann das nicht mehr tragen.")
+            return
+
         # do the actual moving
-        moved = []
-        for obj in to_give:
-            if obj.move_to(target, quiet=True, move_type="give"):
-                moved.append(obj)
-                # Call the object's at_give() method.
-                obj.at_give(caller, target)
+        moved = move_units(to_give, self.number, target, move_type="give")
+        for obj in moved:
+            # Call the object's at_give() method.
+            obj.at_give(caller, target)
 
         if not moved:
             caller.msg(f"Das kannst du nicht {target.get_display_name(caller)} geben.")
         else:
             obj_name = to_give[0].get_numbered_name(
-                len(moved), caller, return_string=True, case="accusative"
+                count_units(moved), caller, return_string=True, case="accusative"
             )
             caller.msg(f"Du übergibst {obj_name} an {target.get_display_name(caller)}.")
             target.msg(f"{caller.get_display_name(target)} gibt dir {obj_name}.")
@@ -529,7 +545,8 @@ class CmdWhisper(general.CmdWhisper):
 
         receivers = [recv.strip() for recv in self.lhs.split(",")]
 
-        receivers = [caller.search(receiver) for receiver in set(receivers)]
+        # resolve all names against the same candidates (duplicates removed, order kept)
+        receivers = caller.search_many(dict.fromkeys(receivers))
         receivers = [recv for recv in receivers if recv]
 
         speech = self.rhs
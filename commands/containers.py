@@ -2,6 +2,7 @@ from typing import override
 from evennia.commands.cmdset import CmdSet
 from evennia.commands.default.general import NumberedTargetCommand
 from evennia.utils import utils
+from typeclasses.items import count_units, move_units
 from .commands_de import CmdGet, CmdLook, CmdDrop
 
 
@@ -132,13 +133,18 @@ class CmdContainerGet(CmdGet):
             if not obj.at_pre_get(caller):
                 return
 
-        moved = []
+        # check the weight before anything moves
+        if hasattr(caller, "can_carry") and not caller.can_carry(
+            min(count_units(objs), self.number or 1), objs[0]
+        ):
+            self.msg("Das ist dir zu schwer.")
+            return
+
         # attempt to move all of the objects
-        for obj in objs:
-            if obj.move_to(caller, quiet=True, move_type="get"):
-                moved.append(obj)
-                # calling at_get hook method
-                obj.at_get(caller)
+        moved = move_units(objs, self.number, caller, move_type="get")
+        for obj in moved:
+            # calling at_get hook method
+            obj.at_get(caller)
 
         if not moved:
             # none of the objects were successfully moved
@@ -146,24 +152,24 @@ class CmdContainerGet(CmdGet):
             return
         else:
             obj_name = moved[0].get_numbered_name(
-                len(moved), caller, return_string=True, case="accusative"
+                count_units(moved), caller, return_string=True, case="accusative"
             )
 
-        # enumerate objects in same location as caller (exclue caller itself)
-        contents = caller.location.contents
-        exclude = utils.make_iter(caller)
-        contents = [obj for obj in contents if obj not in exclude]
-
         container_name, _ = location.get_numbered_name(
             1, caller, case="dative", definite_article=True
         )
 
-        for receiver in contents:
-            caller_name = caller.get_display_name(receiver)
-            if location == caller.location:
-                receiver.msg(f"{caller_name} nimmt sich {obj_name}.")
-            else:
-                receiver.msg(f"{caller_name} nimmt sich {obj_name} aus {container_name}.")
+        # announce to everyone else in the same location as caller
+        if location == caller.location:
+            message = "{caller} nimmt sich {obj_name}."
+        else:
+            message = "{caller} nimmt sich {obj_name} aus {container_name}."
+        caller.location.broadcast(
+            message,
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "obj_name": obj_name, "container_name": container_name},
+        )
 
         if location == caller.location:
             caller.msg(f"Du nimmst dir {obj_name}.")
@@ -233,8 +239,12 @@ class CmdPut(NumberedTargetCommand):
                 self.msg("Du kannst da nichts reintun.")
             return
 
-        # do the actual putting
-        moved = []
+        # decide in one step how many of the objects fit
+        if hasattr(container, "count_admissible"):
+            objs = objs[: container.count_admissible(caller, objs)]
+
+        # check which objects can be put in
+        to_put = []
         for obj in objs:
             # Call the object's at_pre_drop() method.
             if not obj.at_pre_drop(caller):
@@ -242,16 +252,21 @@ class CmdPut(NumberedTargetCommand):
                 continue
 
             # Call the container's possible at_pre_put_in method.
-            if hasattr(container, "at_pre_put_in") and not container.at_pre_put_in(caller, obj):
+            # `pending` are the objects that are already accepted but not moved yet
+            if hasattr(container, "at_pre_put_in") and not container.at_pre_put_in(
+                caller, obj, pending=len(to_put)
+            ):
                 # TODO: add error message string to at_pre_put_in() instead calling msg here
                 self.msg("Das kannst du nicht da rein tun.")
                 continue
 
-            # move objects            
-            if obj.move_to(container, quiet=True, move_type="drop"):
-                moved.append(obj)
-                # Call the object's at_drop() method.
-                obj.at_drop(caller)
+            to_put.append(obj)
+
+        # do the actual putting
+        moved = move_units(to_put, self.number, container, move_type="drop")
+        for obj in moved:
+            # Call the object's at_drop() method.
+            obj.at_drop(caller)
 
         if not moved:
             # none of the objects were successfully moved
@@ -259,20 +274,19 @@ class CmdPut(NumberedTargetCommand):
             return
         else:
             obj_name = moved[0].get_numbered_name(
-                len(moved), caller, return_string=True, case="accusative"
+                count_units(moved), caller, return_string=True, case="accusative"
             )
 
-        # enumerate objects in same location as caller
-        contents = caller.location.contents
-        exclude = utils.make_iter(caller)
-        contents = [obj for obj in contents if obj not in exclude]
-
         container_name, _ = container.get_numbered_name(
             1, caller, case="accusative", definite_article=True
         )
 
-        for receiver in contents:
-            caller_name = caller.get_display_name(receiver)
-            receiver.msg(f"{caller_name} tut {obj_name} in {container_name}.")
+        # announce to everyone else in the same location as caller
+        caller.location.broadcast(
+            "{caller} tut {obj_name} in {container_name}.",
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "obj_name": obj_name, "container_name": container_name},
+        )
 
         caller.msg(f"Du tust {obj_name} in {container_name}.")
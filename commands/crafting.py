@@ -0,0 +1,63 @@
+from typing import override
+from django.conf import settings
+from evennia.utils.utils import class_from_module, iter_to_str
+from world.crafting import RECIPE_INDEX, craft
+
+COMMAND_DEFAULT_CLASS = class_from_module(settings.COMMAND_DEFAULT_CLASS)
+
+
+class CmdCraft(COMMAND_DEFAULT_CLASS):
+    """
+    stelle etwas her
+
+    Benutzung:
+      herstellen
+      herstellen <rezept>
+
+    Ohne Argument siehst du, was du mit deinem Inventar herstellen kannst.
+    Mit einem Rezept werden die Materialien aus deinem Inventar verbraucht
+    und das Ergebnis landet in deinem Inventar. Werkzeuge werden nicht verbraucht.
+    """
+
+    key = "herstellen"
+    aliases = [
+        "stelle her",
+        "fertige",
+        "fertigen",
+    ]
+    locks = "cmd:all()"
+    arg_regex = r"\s|$"
+
+    @override
+    def func(self):
+        caller = self.caller
+
+        if not self.args:
+            recipes = RECIPE_INDEX.craftable(caller.contents)
+            if not recipes:
+                self.msg("Mit deinem Inventar kannst du nichts herstellen.")
+            else:
+                names = iter_to_str((recipe["key"] for recipe in recipes), endsep="und")
+                self.msg(f"Du kannst herstellen: {names}")
+            return
+
+        recipe = RECIPE_INDEX.get(self.args)
+        if not recipe:
+            self.msg(f"Du weißt nicht, wie man '{self.args.strip()}' herstellt.")
+            return
+
+        results = craft(caller, recipe)
+        if not results:
+            self.msg(f"Dir fehlt etwas, um {recipe['key']} herzustellen.")
+            return
+
+        obj_name = results[0].get_numbered_name(
+            recipe.get("quantity", 1), caller, return_string=True, case="accusative"
+        )
+        caller.location.broadcast(
+            "{caller} stellt {obj_name} her.",
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "obj_name": obj_name},
+        )
+        caller.msg(f"Du stellst {obj_name} her.")
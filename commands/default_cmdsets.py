@@ -22,6 +22,9 @@ from evennia.commands.default import (
 from commands import commands_de
 from commands import commands_lock
 from .containers import ContainerCmdSet
+from .crafting import CmdCraft
+from .seed import CmdSeedWorld
+from .fires import CmdIgnite
 
 
 class CharacterCmdSet(default_cmds.CharacterCmdSet):
@@ -71,6 +74,12 @@ class CharacterCmdSet(default_cmds.CharacterCmdSet):
 
         # Container commands
         self.add(ContainerCmdSet)
+        # Fire commands
+        self.add(CmdIgnite())
+        # Crafting commands
+        self.add(CmdCraft())
+        # Building commands
+        self.add(CmdSeedWorld())
 
 
 class AccountCmdSet(default_cmds.AccountCmdSet):
@@ -0,0 +1,60 @@
+from typing import override
+from django.conf import settings
+from evennia.utils.utils import class_from_module
+
+COMMAND_DEFAULT_CLASS = class_from_module(settings.COMMAND_DEFAULT_CLASS)
+
+# tool needed to light a fire (tag key, category)
+IGNITION_TOOL = ("feuerstein", "crafting_tool")
+
+
+class CmdIgnite(COMMAND_DEFAULT_CLASS):
+    """
+    entzünde ein Feuer
+
+    Benutzung:
+      entzünde <feuerstelle>
+
+    Entzündet das Brennmaterial in einer Feuerstelle.
+    Dafür brauchst du einen Feuerstein in deinem Inventar.
+    """
+
+    key = "entzünde"
+    aliases = [
+        "entzünden",
+        "zünde",
+        "anzünden",
+    ]
+    locks = "cmd:all()"
+    arg_regex = r"\s|$"
+
+    @override
+    def func(self):
+        caller = self.caller
+        if not self.args:
+            self.msg("Was willst du entzünden?")
+            return
+
+        fire = caller.search(self.args.strip())
+        if not fire:
+            return
+        if not hasattr(fire, "ignite"):
+            self.msg(f"{fire.get_display_name(caller)} lässt sich nicht entzünden.")
+            return
+
+        key, category = IGNITION_TOOL
+        if not any(obj.tags.has(key, category=category) for obj in caller.contents):
+            self.msg("Du brauchst einen Feuerstein, um ein Feuer zu machen.")
+            return
+
+        if not fire.ignite(caller):
+            return
+
+        fire_name, _ = fire.get_numbered_name(1, caller, definite_article=True, case="accusative")
+        caller.location.broadcast(
+            "{caller} entzündet {fire_name}.",
+            exclude=caller,
+            from_obj=caller,
+            mapping={"caller": caller, "fire_name": fire_name},
+        )
+        caller.msg(f"Du entzündest {fire_name}.")
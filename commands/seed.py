@@ -0,0 +1,33 @@
+from typing import override
+from django.conf import settings
+from evennia.utils.utils import class_from_module
+from world.seed import load_seed, seed_world, SEED_FILE
+
+COMMAND_DEFAULT_CLASS = class_from_module(settings.COMMAND_DEFAULT_CLASS)
+
+
+class CmdSeedWorld(COMMAND_DEFAULT_CLASS):
+    """
+    baue die Welt aus einer Seed-Datei
+
+    Benutzung:
+      @seed [<datei>]
+
+    Erstellt Räume, Ausgänge und Objekte aus der Seed-Datei
+    (Standard: world/seed.json). Bereits erstellte Teile werden nur
+    aktualisiert, es wird also nur der Unterschied angewendet.
+    """
+
+    key = "@seed"
+    locks = "cmd:perm(Developer)"
+    help_category = "Building"
+
+    @override
+    def func(self):
+        path = self.args.strip() or SEED_FILE
+        try:
+            stats = seed_world(load_seed(path))
+        except (OSError, ValueError, KeyError) as err:
+            self.msg(f"|rSeed fehlgeschlagen:|n {err}")
+            return
+        self.msg(f"Seed angewendet: {stats['created']} erstellt, {stats['updated']} aktualisiert.")
@@ -14,6 +14,9 @@ does what you expect it to.
 
 """
 
+from world.seed import seed_world
+
 
 def at_initial_setup():
-    pass
+    # build the world from world/seed.json
+    seed_world()
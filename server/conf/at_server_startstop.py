@@ -17,6 +17,10 @@ at_server_cold_stop()
 
 """
 
+from world import burn
+from world.spawner import compile_prototypes
+from world.statstore import start_flush_timer, stop_flush_timer
+
 
 def at_server_init():
     """
@@ -30,7 +34,11 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    start_flush_timer()
+    # flatten all module prototypes once
+    compile_prototypes()
+    # burn-out times of burning fires are not persistent
+    burn.resume()
 
 
 def at_server_stop():
@@ -38,7 +46,8 @@ def at_server_stop():
     This is called just before the server is shut down, regardless
     of it is for a reload, reset or shutdown.
     """
-    pass
+    # write buffered stats (hp, xp, ...) to the database
+    stop_flush_timer()
 
 
 def at_server_reload_start():
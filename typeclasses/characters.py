@@ -12,25 +12,53 @@ from typing import Optional, cast, override
 from evennia.accounts.accounts import DefaultAccount
 from evennia.objects.objects import DefaultCharacter, DefaultObject
 from evennia.typeclasses.attributes import AttributeProperty
+from evennia.utils.utils import delay
+from world import gold_ledger
 from world.health_bar import display_meter
+from world.statstore import BufferedAttributeProperty, DurableAttributeProperty
 from .objects import ObjectParent
 
+# counters of update_prompt(), see prompt_stats()
+PROMPT_STATS = {"requested": 0, "coalesced": 0, "unchanged": 0, "sent": 0}
+
+
+def prompt_stats():
+    """
+    Get the counters of the prompt scheduler.
+
+    Returns:
+        dict: `{"requested", "coalesced", "unchanged", "sent", "suppressed"}`, where
+            `suppressed` are the requests that did not lead to a prompt being sent.
+
+    """
+    stats = dict(PROMPT_STATS)
+    stats["suppressed"] = stats["coalesced"] + stats["unchanged"]
+    return stats
+
 
 class CharacterParent(ObjectParent):
     """
     Mixin for all characters (player and non-player)
     """
 
-    hp = AttributeProperty(default=1)
+    # hot stats are buffered in memory and written in batches (see world.statstore)
+    hp = BufferedAttributeProperty(default=1)
     hp_max = AttributeProperty(default=1)
     # see: heal(), damage()
 
-    gold = AttributeProperty(default=0)
-    # TODO: gold_add(), gold_sub(), gold_set()
+    # written at once, together with the buffered stats
+    gold = DurableAttributeProperty(default=0)
+    # see: gold_set(), gold_diff() and world.gold_ledger
+
+    # maximum weight the character can carry, see can_carry()
+    carry_capacity = AttributeProperty(default=100)
 
     # used in get_display_name()
     color_code = AttributeProperty(default="|c")
 
+    # seconds to collect prompt updates before sending one prompt (0: once per reactor tick)
+    prompt_interval = 0
+
     @override
     def at_object_creation(self):
         super().at_object_creation()
@@ -46,12 +74,73 @@ class CharacterParent(ObjectParent):
         return ""
         # TODO: add lock for peeking in inventar of others (maybe special skill?)
 
+    def can_carry(self, count: int, item) -> bool:
+        """
+        Check if the character can pick up `count` units of `item` without being
+        overloaded. Uses the running total `carried_weight`, so no inventory is walked.
+
+        Args:
+            count (int): Number of units (items of the same kind or units of a stack).
+            item (Object): The item (or one of the items).
+
+        Returns:
+            bool: True if it can be carried.
+
+        """
+        # things already carried (e.g. taken out of an own bag) don't add weight
+        location = item.location
+        while location:
+            if location is self:
+                return True
+            location = location.location
+
+        unit_weight = getattr(item, "weight", 0) or 0
+        weight = count * unit_weight + item.carried_weight
+        return self.carried_weight + weight <= cast(float, self.carry_capacity)
+
     def get_prompt(self):
         health_bar = display_meter(self.hp, self.hp_max)
         return f"{self.get_display_name()} | HP: {health_bar} | |540Gold: {self.gold}|n"
 
-    def update_prompt(self):
-        self.msg(prompt=self.get_prompt())
+    def update_prompt(self, force=False):
+        """
+        Request a prompt update. Updates are coalesced: the prompt is rendered and sent
+        at most once per `prompt_interval` (once per reactor tick by default), and not
+        at all if it did not change since the last one sent.
+
+        Args:
+            force (bool): Send the prompt now, even if it did not change
+                (e.g. for a new session).
+
+        """
+        PROMPT_STATS["requested"] += 1
+        if force:
+            self.flush_prompt(force=True)
+        elif self.ndb.prompt_pending:
+            PROMPT_STATS["coalesced"] += 1
+        else:
+            self.ndb.prompt_pending = True
+            delay(self.prompt_interval, self.flush_prompt)
+
+    def flush_prompt(self, force=False):
+        """
+        Send the prompt if it changed since the last one sent. Called by `update_prompt`.
+
+        Args:
+            force (bool): Send the prompt even if it did not change.
+
+        """
+        self.ndb.prompt_pending = False
+        if not self.pk:
+            # deleted in the meantime
+            return
+        prompt = self.get_prompt()
+        if not force and prompt == self.ndb.last_prompt:
+            PROMPT_STATS["unchanged"] += 1
+            return
+        self.ndb.last_prompt = prompt
+        PROMPT_STATS["sent"] += 1
+        self.msg(prompt=prompt)
 
     def heal(self, healing: int, healer=None):
         """
@@ -112,10 +201,10 @@ class CharacterParent(ObjectParent):
     # @override
     # def at_post_unpuppet(self, account: Optional[DefaultAccount] = None, session=None, **kwargs):
 
-    def gold_set(self, amount: int, **kwargs):
+    def gold_set(self, amount: int, reason="", **kwargs):
         """
-        Add the positive or negative amount of gold to the current self.gold attribute.
-        If the result is negative: abort, return None
+        Set self.gold to a new amount via the gold ledger (see `world.gold_ledger`).
+        If the amount is negative: abort, return None
         Else execute transaction an return amount
         """
         amount = int(amount)
@@ -123,27 +212,30 @@ class CharacterParent(ObjectParent):
             return None
 
         diff: int = amount - self.gold  # type: ignore
-        self.gold = amount
-        self.at_pot_gold_change(diff)
+        if diff >= 0:
+            gold_ledger.transfer(None, self, diff, reason=reason or "gold_set")
+        else:
+            gold_ledger.transfer(self, None, -diff, reason=reason or "gold_set")
         return amount
 
-    def gold_diff(self, amount: int, **kwargs):
+    def gold_diff(self, amount: int, reason="", **kwargs):
         """
-        Add the positive or negative amount of gold to the current self.gold attribute.
+        Add the positive or negative amount of gold to the current self.gold attribute
+        via the gold ledger (see `world.gold_ledger`).
         If the result is negative: abort, return None
         Else execute transaction an return amount
         """
         amount = int(amount)
-        if cast(int, self.gold) + amount < 0:
-            return None
-
-        self.gold += amount  # type: ignore
-        self.at_pot_gold_change(amount)
-        return amount
+        if amount >= 0:
+            done = gold_ledger.transfer(None, self, amount, reason=reason or "gold_diff")
+        else:
+            done = gold_ledger.transfer(self, None, -amount, reason=reason or "gold_diff")
+        return amount if done else None
 
     def at_pot_gold_change(self, amount: int, **kwargs):
         """
-        Called after the gold attribute changed via gold_set or gold_diff
+        Called after the gold attribute changed via the gold ledger (e.g. gold_set or
+        gold_diff), once per settlement with the net change.
         """
         if amount < 0:
             self.msg(f"Du verlierst |540Gold: {amount}|n.")
@@ -164,9 +256,9 @@ class Character(CharacterParent, DefaultCharacter):
 
     """
 
-    level = AttributeProperty(default=1)
-    xp = AttributeProperty(default=0)
-    reputation = AttributeProperty(default=0)
+    level = BufferedAttributeProperty(default=1)
+    xp = BufferedAttributeProperty(default=0)
+    reputation = BufferedAttributeProperty(default=0)
 
     # @override
     # def at_object_creation(self):
@@ -176,7 +268,7 @@ class Character(CharacterParent, DefaultCharacter):
     def at_post_puppet(self, **kwargs):
         # show health bar
         super().at_post_puppet(**kwargs)
-        self.update_prompt()
+        self.update_prompt(force=True)
 
     @override
     def get_prompt(self):
@@ -210,7 +302,7 @@ class NPC(CharacterParent, DefaultCharacter):
             puppeting this Object.
 
         """
-        self_location = cast(DefaultObject, self.location)
+        self_location = cast(ObjectParent, self.location)
 
         self.msg(
             "Dein Geist fährt in den Körper von {name}. Test gold: {gold}".format(
@@ -232,7 +324,8 @@ class NPC(CharacterParent, DefaultCharacter):
         # look around
         self.msg((self.at_look(self_location), {"type": "look"}), options=None)
         # show health bar
-        self.update_prompt()
+        self.update_prompt(force=True)
+        self_location.update_occupant(self)
 
     @override
     def at_post_unpuppet(self, account: Optional[DefaultAccount] = None, session=None, **kwargs):
@@ -253,7 +346,8 @@ class NPC(CharacterParent, DefaultCharacter):
                 overriding the call (unused by default).
 
         """
-        self_location = cast(DefaultObject, self.location)
+        self_location = cast(ObjectParent, self.location)
+        self_location.update_occupant(self)
         self.msg("Du verlässt den Körper von {name}.\n".format(name=self.get_display_name(self)))
         self.msg((self.at_look(self_location), {"type": "look"}), options=None)
 
@@ -21,6 +21,9 @@ class Container(Ownable, Object):
      - at_pre_put_in()
 
     It implements a very basic "size" limitation that is just a flat number of objects.
+    The number of objects inside and their total weight are tracked in memory
+    (see `get_content_stats` and `carried_weight`), so capacity checks don't load
+    the contents.
     """
 
     obj_type = [ObjectType.CONTAINER]
@@ -71,6 +74,10 @@ class Container(Ownable, Object):
             putter (Object): The actor attempting to put something in this object.
             target (Object): The thing being put into this object.
 
+        Keyword Args:
+            pending (int): Number of objects already accepted in the same batch that
+                are not yet moved into this object.
+
         Returns:
             boolean: Whether the object `target` should be put down or not.
 
@@ -79,7 +86,8 @@ class Container(Ownable, Object):
             To add more complex capacity checks, modify this method on your child typeclass.
         """
         # check if we're already at capacity
-        if len(self.contents) >= cast(int, self.capacity):
+        count = self.get_content_stats()["count"] + kwargs.get("pending", 0)
+        if count >= cast(int, self.capacity):
             singular, _ = self.get_numbered_name(
                 1, putter, definite_article=True, case="accusative"
             )
@@ -88,6 +96,61 @@ class Container(Ownable, Object):
 
         return True
 
+    def count_admissible(self, putter, objs):
+        """
+        Decide in one step how many of `objs` still fit into this object.
+
+        Args:
+            putter (Object): The actor putting things in. Gets a message if not all fit.
+            objs (list): The objects to put in.
+
+        Returns:
+            int: How many of the objects (from the start of the list) fit.
+
+        """
+        free = max(0, cast(int, self.capacity) - self.get_content_stats()["count"])
+        if free < len(objs):
+            singular, _ = self.get_numbered_name(
+                1, putter, definite_article=True, case="accusative"
+            )
+            if free:
+                putter.msg(f"Es passt nicht alles in {singular}.")
+            else:
+                putter.msg(f"Es passt nichts mehr in {singular}.")
+        return min(free, len(objs))
+
+    def get_content_stats(self):
+        """
+        Get the number of objects inside this object and their total weight.
+
+        The count is computed from `contents` on first use and then kept up to date
+        by `at_contents_change`. The weight is `carried_weight`.
+
+        Returns:
+            dict: `{"count": int, "weight": float}`
+
+        """
+        stats = self.ndb.content_stats
+        if stats is None:
+            stats = self.ndb.content_stats = {"count": len(self.contents)}
+        return {"count": stats["count"], "weight": self.carried_weight}
+
+    @override
+    def at_contents_change(self, added=None, removed=None, changed=None, weight_change=0):
+        super().at_contents_change(
+            added=added, removed=removed, changed=changed, weight_change=weight_change
+        )
+        stats = self.ndb.content_stats
+        if stats is None:
+            return
+        if added:
+            stats["count"] += 1
+        elif removed:
+            stats["count"] -= 1
+        elif not changed:
+            # count again on next use
+            self.ndb.content_stats = None
+
     @override
     def get_display_things(self, looker, **kwargs):
         """
@@ -111,6 +174,7 @@ class Container(Ownable, Object):
     # from class Ownable
     @override
     def set_owner(self, setter, target, **kwargs):
+        super().set_owner(setter, target, **kwargs)
         self_locks = cast(LockHandler, self.locks)
         self_locks.add(f"look_into: perm(Builder) or id({target.id})")
         self_locks.add(f"get_from: perm(Admin) or id({target.id})")
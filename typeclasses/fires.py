@@ -0,0 +1,149 @@
+import time
+from typing import cast, override
+from evennia.typeclasses.attributes import AttributeProperty
+from evennia.typeclasses.tags import TagHandler
+from evennia.utils.utils import delay
+from world import burn
+from .containers import Container
+
+
+class Fire(Container):
+    """
+    A fireplace. Items with `fuel` can be put into it and burn for `fuel` seconds.
+
+    The fire does not tick: when it is lit, the fuel inside is used up at once and
+    the time it burns out (`burn_until`) is computed from it. Fuel put into a
+    burning fire extends that time. The burn-out is scheduled by `world.burn`
+    and also checked when someone looks at the fire.
+    """
+
+    # unix time when the fire burns out, 0 if it is not burning
+    burn_until = AttributeProperty(default=0)
+
+    def get_remaining_burn_time(self):
+        """
+        Seconds until the fire burns out, 0 if it is not burning.
+
+        """
+        self.update_burning()
+        return max(0, cast(float, self.burn_until) - time.time())
+
+    def is_burning(self):
+        return self.get_remaining_burn_time() > 0
+
+    def update_burning(self):
+        """
+        Let the fire burn out if its time has come (in case the scheduled
+        burn-out did not run yet).
+
+        """
+        if self.burn_until and cast(float, self.burn_until) <= time.time():
+            self.burn_out()
+
+    def get_fuel_items(self):
+        return [obj for obj in self.contents if getattr(obj, "fuel", 0)]
+
+    def consume_fuel(self, announce=False):
+        """
+        Burn up the fuel items inside. Adds their burn time to `burn_until`.
+
+        Args:
+            announce (bool): Tell the room which items burn (fuel put into a
+                burning fire).
+
+        Returns:
+            float: Seconds of burn time added.
+
+        """
+        fuel_items = self.get_fuel_items()
+        seconds = sum(obj.total_fuel for obj in fuel_items)
+        if not seconds:
+            return 0
+        location = self.location
+        for obj in fuel_items:
+            if announce and location and hasattr(location, "broadcast"):
+                verb = "verbrennt" if obj.quantity == 1 else "verbrennen"
+                location.broadcast(
+                    f"{{item}} {verb} in {{fire}}.",
+                    mapping={
+                        "item": self._numbered_name(obj, obj.quantity, capitalize=True),
+                        "fire": self._numbered_name(self, 1, case="dative"),
+                    },
+                )
+            obj.delete()
+        self.burn_until = max(cast(float, self.burn_until), time.time()) + seconds
+        burn.schedule(self)
+        return seconds
+
+    def ignite(self, igniter):
+        """
+        Light the fire with the fuel inside.
+
+        Args:
+            igniter (Object): Who lights the fire.
+
+        Returns:
+            bool: True if the fire was lit.
+
+        """
+        if self.is_burning():
+            igniter.msg("Das Feuer brennt schon.")
+            return False
+        if not self.consume_fuel():
+            singular, _ = self.get_numbered_name(1, igniter, definite_article=True, case="dative")
+            igniter.msg(f"In {singular} ist nichts, was brennen könnte.")
+            return False
+        cast(TagHandler, self.tags).add(burn.BURNING_TAG[0], category=burn.BURNING_TAG[1])
+        return True
+
+    def burn_out(self):
+        """
+        Called when the fire has used up its fuel.
+
+        """
+        self.burn_until = 0
+        cast(TagHandler, self.tags).remove(burn.BURNING_TAG[0], category=burn.BURNING_TAG[1])
+        location = self.location
+        if location and hasattr(location, "broadcast"):
+            location.broadcast(
+                "{fire} erlischt.", mapping={"fire": self._numbered_name(self, 1, capitalize=True)}
+            )
+
+    @staticmethod
+    def _numbered_name(obj, count, capitalize=False, **kwargs):
+        """
+        A `broadcast` mapping value rendering the numbered name of `obj` with
+        definite article for each receiver ("das Lagerfeuer").
+
+        """
+
+        def render(receiver):
+            name = obj.get_numbered_name(
+                count, receiver, definite_article=True, return_string=True, **kwargs
+            )
+            return name[:1].upper() + name[1:] if capitalize else name
+
+        return render
+
+    @override
+    def at_pre_put_in(self, putter, target, **kwargs):
+        if not getattr(target, "fuel", 0):
+            putter.msg(f"{target.get_display_name(putter)} brennt nicht.")
+            return False
+        return super().at_pre_put_in(putter, target, **kwargs)
+
+    @override
+    def at_object_receive(self, moved_obj, source_location, move_type="move", **kwargs):
+        super().at_object_receive(moved_obj, source_location, move_type=move_type, **kwargs)
+        if self.is_burning():
+            # burn it after the current command is done, so it can still use the object
+            delay(0, self.consume_fuel, announce=True)
+
+    @override
+    def get_display_desc(self, looker, **kwargs):
+        desc = super().get_display_desc(looker, **kwargs)
+        remaining = self.get_remaining_burn_time()
+        if remaining:
+            minutes = max(1, round(remaining / 60))
+            return f"{desc}\nDas Feuer brennt noch etwa {minutes} Minuten."
+        return f"{desc}\nDas Feuer ist aus."
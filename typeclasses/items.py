@@ -1,6 +1,11 @@
-from evennia.typeclasses.attributes import AttributeProperty
+from typing import cast, override
+from django.db import transaction
+from evennia.typeclasses.attributes import AttributeHandler, AttributeProperty
+from evennia.typeclasses.tags import TagHandler
+from evennia.utils.utils import delay
 from .objects import Object
 from world.enums import ObjectType
+from world.spawner import get_spawn_plan
 
 
 class Item(Object):
@@ -15,3 +20,176 @@ class Item(Object):
 
     # worth of gold
     worth = AttributeProperty(default=0)
+
+    # number of units of a stack (weight, fuel and worth are per unit)
+    quantity = AttributeProperty(default=1, autocreate=False)
+
+    @property
+    def stackable(self):
+        """
+        Stackable items of the same prototype are merged into one object with a
+        quantity.
+
+        Taken from the prototype the item was spawned from (the compiled spawn
+        plan, see `world.spawner`), so items spawned before the prototype became
+        stackable stack too. Items without a compiled prototype use their
+        "stackable" Attribute.
+
+        """
+        prototype_key = cast(TagHandler, self.tags).get(category="from_prototype")
+        if prototype_key:
+            plan = get_spawn_plan(prototype_key)
+            if plan:
+                return plan.stackable
+        return bool(cast(AttributeHandler, self.attributes).get("stackable", default=False))
+
+    @property
+    def total_weight(self):
+        return self.weight * self.quantity  # type: ignore
+
+    @property
+    def total_fuel(self):
+        return self.fuel * self.quantity  # type: ignore
+
+    @property
+    def total_worth(self):
+        return self.worth * self.quantity  # type: ignore
+
+    def get_stack_key(self):
+        """
+        Items with the same stack key can be merged. Only stackable items
+        spawned from a prototype have one.
+
+        Returns:
+            tuple or None: `(prototype_key, key)`
+
+        """
+        if not self.stackable:
+            return None
+        prototype_key = cast(TagHandler, self.tags).get(category="from_prototype")
+        if not prototype_key:
+            return None
+        return (prototype_key, self.key)
+
+    def split_stack(self, count: int):
+        """
+        Split `count` units off this stack into a new object at the same location.
+
+        Args:
+            count (int): Number of units to split off.
+
+        Returns:
+            Item: The new stack, or `self` if `count` covers the whole stack.
+
+        """
+        quantity = cast(int, self.quantity)
+        if count >= quantity:
+            return self
+        location = self.location
+        weight = self.gross_weight
+        if location:
+            # the location is told below, when the new stack has its quantity
+            location.ndb.creating_quietly = True
+        try:
+            # no duplicated units if anything fails in between
+            with transaction.atomic():
+                new_stack = cast(Item, self.copy())
+                new_stack.quantity = count
+                self.quantity = quantity - count
+        finally:
+            if location:
+                location.ndb.creating_quietly = None
+        if location and hasattr(location, "at_contents_change"):
+            location.at_contents_change(changed=self, weight_change=self.gross_weight - weight)
+            location.at_contents_change(added=new_stack)
+        return new_stack
+
+    def join_stack(self):
+        """
+        Merge this stack into another stack of the same kind at the same location.
+
+        Returns:
+            Item: The stack now holding the units (`self` if nothing was merged).
+
+        """
+        stack_key = self.get_stack_key()
+        location = self.location
+        if not self.pk or not stack_key or not location:
+            return self
+        for other in location.contents_get(content_type="object"):
+            if other is not self and isinstance(other, Item) and other.get_stack_key() == stack_key:
+                weight = other.gross_weight
+                other.quantity += self.quantity  # type: ignore
+                self.delete()
+                location.at_contents_change(
+                    changed=other, weight_change=other.gross_weight - weight
+                )
+                return other
+        return self
+
+    @override
+    def at_post_move(self, source_location, move_type="move", **kwargs):
+        super().at_post_move(source_location, move_type=move_type, **kwargs)
+        if self.stackable:
+            # merge after the current command is done, so it can still use this object
+            delay(0, self.join_stack)
+
+
+def count_units(objs):
+    """
+    Count the units in a list of objects, taking stack quantities into account.
+
+    """
+    return sum(obj.quantity for obj in objs)
+
+
+def take_units(objs, count):
+    """
+    Get objects covering `count` units, splitting a stack if needed.
+
+    Args:
+        objs (list): Objects as returned from a (stacked) search.
+        count (int): Number of units wanted. 0 means one unit.
+
+    Returns:
+        list: The objects to move. May cover fewer units if there are not enough.
+
+    """
+    remaining = max(count, 1)
+    taken = []
+    for obj in objs:
+        if remaining <= 0:
+            break
+        if isinstance(obj, Item) and obj.quantity > remaining:  # type: ignore
+            obj = obj.split_stack(remaining)
+        taken.append(obj)
+        remaining -= obj.quantity
+    return taken
+
+
+def move_units(objs, count, destination, move_type="move", **kwargs):
+    """
+    Move objects covering `count` units to `destination` (see `take_units` and
+    `ObjectParent.bulk_move_to`).
+
+    The stack is split before the move, so the move hooks see the real quantity.
+    A split-off stack whose move is refused is merged back into its stack.
+
+    Args:
+        objs (list): Objects as returned from a (stacked) search.
+        count (int): Number of units wanted. 0 means one unit.
+        destination (DefaultObject): Where to move them.
+        move_type (str): The type of move ("get", "drop", ...).
+        **kwargs: Passed on to `bulk_move_to`.
+
+    Returns:
+        list: The moved objects.
+
+    """
+    taken = take_units(objs, count)
+    moved = Object.bulk_move_to(taken, destination, move_type=move_type, **kwargs)
+    for obj in taken:
+        if obj not in objs and obj not in moved:
+            # split off for this move, but not moved
+            obj.join_stack()
+    return moved
@@ -8,16 +8,228 @@ with a location in the game world (like Characters, Rooms, Exits).
 
 """
 
+import random
 from collections import defaultdict
 from typing import Iterable, Optional, Self, cast, override
+from django.db import transaction
 from django.utils.translation import gettext as _
 from evennia.objects.models import ObjectDB
 from evennia.objects.objects import DefaultObject
-from evennia.typeclasses.attributes import AttributeProperty
+from evennia.typeclasses.attributes import AttributeProperty, ModelAttributeBackend
 from evennia.typeclasses.models import AttributeHandler
-from evennia.typeclasses.tags import AliasHandler, TagHandler
-from evennia.utils.utils import iter_to_str, make_iter
+from evennia.typeclasses.tags import AliasHandler, Tag, TagHandler
+from evennia.utils.utils import iter_to_str, lazy_property, make_iter
+from world.declension import numbered_article, singular_article
 from world.enums import ObjectType
+from world.search_index import SearchIndex, split_match_number
+from world.statstore import discard_pending
+
+
+# number of lookers whose rendered contents are kept per location
+# (see `ObjectParent.get_display_contents`)
+APPEARANCE_CACHE_SIZE = 32
+
+# hit/miss counters of the display name cache (see `ObjectParent.get_display_name`)
+DISPLAY_NAME_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def display_name_cache_stats():
+    """
+    Get the counters of the display name cache.
+
+    Returns:
+        dict: `{"hits": int, "misses": int, "hit_rate": float}`
+
+    """
+    hits = DISPLAY_NAME_CACHE_STATS["hits"]
+    misses = DISPLAY_NAME_CACHE_STATS["misses"]
+    total = hits + misses
+    return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+
+
+class ViewerMapping(dict):
+    """
+    A `format_map` mapping with fields that depend on the viewer. The viewer
+    fields are only computed when the format string uses them.
+
+    Args:
+        mapping (dict): Fields that are the same for every viewer.
+        viewer_fields (dict): `{field: callable(viewer)}` for the other fields.
+            Fields in `mapping` take precedence.
+        viewer (DefaultObject): The object the text is formatted for.
+
+    """
+
+    def __init__(self, mapping, viewer_fields, viewer):
+        super().__init__(mapping)
+        self.viewer_fields = viewer_fields
+        self.viewer = viewer
+
+    def __missing__(self, key):
+        value = self[key] = self.viewer_fields[key](self.viewer)
+        return value
+
+
+class OccupantSet:
+    """
+    Set of the connected characters in a location (see `ObjectParent.get_occupants`)
+    with O(1) add, discard and random choice.
+
+    """
+
+    def __init__(self, objs=()):
+        self._objs = []
+        self._positions = {}
+        for obj in objs:
+            self.add(obj)
+
+    def __contains__(self, obj):
+        return obj in self._positions
+
+    def __iter__(self):
+        return iter(list(self._objs))
+
+    def __len__(self):
+        return len(self._objs)
+
+    def add(self, obj):
+        if obj not in self._positions:
+            self._positions[obj] = len(self._objs)
+            self._objs.append(obj)
+
+    def discard(self, obj):
+        position = self._positions.pop(obj, None)
+        if position is None:
+            return
+        # move the last object into the gap
+        last = self._objs.pop()
+        if last is not obj:
+            self._objs[position] = last
+            self._positions[last] = position
+
+    def random_choice(self):
+        """
+        Get a random occupant, None if there is none.
+
+        """
+        return random.choice(self._objs) if self._objs else None
+
+
+class ExitIndex:
+    """
+    The exits in a location by destination (see `ObjectParent.get_exits_to`).
+    Every exit is kept under the destination it had when it was added, so an
+    exit that was re-linked has to be added again.
+
+    """
+
+    def __init__(self, exits=()):
+        self._by_destination = defaultdict(list)
+        self._destinations = {}
+        for exi in exits:
+            self.add(exi)
+
+    def __contains__(self, exi):
+        return exi in self._destinations
+
+    def add(self, exi):
+        """
+        Index an exit (again, under its current destination).
+
+        """
+        self.discard(exi)
+        destination = exi.destination
+        self._destinations[exi] = destination
+        self._by_destination[destination].append(exi)
+
+    def discard(self, exi):
+        if exi not in self._destinations:
+            return
+        destination = self._destinations.pop(exi)
+        exits = self._by_destination[destination]
+        exits.remove(exi)
+        if not exits:
+            del self._by_destination[destination]
+
+    def get(self, destination):
+        """
+        Get the exits leading to `destination`.
+
+        """
+        return list(self._by_destination.get(destination, ()))
+
+
+class TagChangeMixin:
+    """
+    Mixin for tag handlers. Calls `at_tags_change(tagtype, category)` on the
+    object after every add, remove or clear, so caches built from tags or
+    aliases (noun forms, search index) can be updated.
+
+    """
+
+    def add(self, key=None, category=None, data=None):
+        super().add(key=key, category=category, data=data)
+        self._at_change(category)
+
+    def remove(self, key=None, category=None):
+        super().remove(key=key, category=category)
+        self._at_change(category)
+
+    def clear(self, category=None):
+        super().clear(category=category)
+        self._at_change(category)
+
+    def _at_change(self, category):
+        at_tags_change = getattr(self.obj, "at_tags_change", None)
+        if at_tags_change:
+            at_tags_change(self._tagtype, category)
+
+
+class ObjectTagHandler(TagChangeMixin, TagHandler):
+    """
+    TagHandler of `ObjectParent`, see `TagChangeMixin`.
+
+    """
+
+
+class ObjectAliasHandler(TagChangeMixin, AliasHandler):
+    """
+    AliasHandler of `ObjectParent`, see `TagChangeMixin`.
+
+    """
+
+
+class ObjectAttributeHandler(AttributeHandler):
+    """
+    AttributeHandler of `ObjectParent`. Calls `at_attribute_change(key, category)`
+    on the object after Attributes were added or removed (also by `@set`), so
+    caches built from Attributes can be updated. `key` is None if all
+    Attributes (of a category) were removed.
+
+    """
+
+    def add(self, key, value, category=None, **kwargs):
+        super().add(key, value, category=category, **kwargs)
+        self._at_change(key, category)
+
+    def batch_add(self, *args, **kwargs):
+        super().batch_add(*args, **kwargs)
+        for attr in args:
+            self._at_change(attr[0], attr[2] if len(attr) > 2 else None)
+
+    def remove(self, key=None, category=None, **kwargs):
+        super().remove(key=key, category=category, **kwargs)
+        for attr_key in make_iter(key):
+            self._at_change(attr_key, category)
+
+    def clear(self, category=None, **kwargs):
+        super().clear(category=category, **kwargs)
+        self._at_change(None, category)
+
+    def _at_change(self, key, category):
+        at_attribute_change = getattr(self.obj, "at_attribute_change", None)
+        if at_attribute_change:
+            at_attribute_change(key, category)
 
 
 class ObjectParent(DefaultObject):
@@ -37,6 +249,21 @@ class ObjectParent(DefaultObject):
     # used in get_display_name()
     color_code = AttributeProperty(default="|w")
 
+    # number of units this object stands for (see `Item.stackable`)
+    quantity = 1
+
+    @lazy_property
+    def attributes(self):
+        return ObjectAttributeHandler(self, ModelAttributeBackend)
+
+    @lazy_property
+    def tags(self):
+        return ObjectTagHandler(self)
+
+    @lazy_property
+    def aliases(self):
+        return ObjectAliasHandler(self)
+
     # TODO: evaluate LANGUAGE_CODE and only overwrite methods if German (DE)
     # TODO: i18n of Strings from "mygame". Possibly add pullrequest to mark Strings here with _("...") so you don't need to overwrite get_display_things
 
@@ -56,9 +283,23 @@ class ObjectParent(DefaultObject):
             This function can be extended to change how object names appear to users in character,
             but it does not change an object's keys or aliases when searching.
 
+            The result is cached in memory per (looker typeclass, name), so the
+            `color_code` Attribute is only read once. The cache is dropped when
+            `color_code` changes, also by `@set` (see `at_attribute_change`).
+
         """
         name = kwargs.get("key", self.name)
-        return f"{self.color_code}{name}|n"
+        cache = self.ndb.display_names
+        if cache is None:
+            cache = self.ndb.display_names = {}
+        cache_key = (type(looker), name)
+        display_name = cache.get(cache_key)
+        if display_name is None:
+            DISPLAY_NAME_CACHE_STATS["misses"] += 1
+            display_name = cache[cache_key] = f"{self.color_code}{name}|n"
+        else:
+            DISPLAY_NAME_CACHE_STATS["hits"] += 1
+        return display_name
 
     @override
     def get_search_direct_match(self, searchdata, **kwargs):
@@ -87,6 +328,257 @@ class ObjectParent(DefaultObject):
                     return global_search or self.location in candidates, self.location
         return False, searchdata
 
+    @override
+    def get_search_result(
+        self,
+        searchdata,
+        attribute_name=None,
+        typeclass=None,
+        candidates=None,
+        exact=False,
+        use_dbref=None,
+        tags=None,
+        **kwargs,
+    ):
+        """
+        This method is called by the search method to perform the actual search.
+
+        Overwrite: local searches (with `candidates`) by name are answered from the
+        in-memory search indexes of the candidates' locations (see
+        `get_search_index`) instead of the database. Searches by dbref, Attribute,
+        typeclass or tags and global searches use the default implementation.
+
+        A match number ("2-stein", see `settings.SEARCH_MULTIMATCH_REGEX`) picks
+        one of several matches, in the order of the multimatch list (by dbref).
+
+        Returns:
+            list: The matching objects.
+
+        """
+        if (
+            candidates is None
+            or attribute_name
+            or typeclass
+            or tags
+            or not isinstance(searchdata, str)
+            or searchdata.strip().startswith("#")
+        ):
+            return super().get_search_result(
+                searchdata,
+                attribute_name=attribute_name,
+                typeclass=typeclass,
+                candidates=candidates,
+                exact=exact,
+                use_dbref=use_dbref,
+                tags=tags,
+                **kwargs,
+            )
+
+        match_number, searchdata = split_match_number(searchdata)
+        candidates = list(candidates)
+        candidate_set = set(candidates)
+        indexes = self._get_search_indexes(candidates)
+
+        for match_type in ("exact",) if exact else ("exact", "prefix"):
+            results = [
+                obj
+                for index in indexes
+                for obj in getattr(index, match_type)(searchdata)
+                if obj in candidate_set
+            ]
+            if results:
+                results.sort(key=lambda obj: obj.id)
+                if match_number is not None:
+                    return [results[match_number]] if 0 <= match_number < len(results) else []
+                return results
+        return []
+
+    @staticmethod
+    def _get_search_indexes(candidates):
+        """
+        The search indexes covering `candidates`.
+
+        Candidates in a location are looked up in the cached index of that
+        location (see `get_search_index`), the others (e.g. rooms, which have no
+        location) in a small index built for them. The location indexes cover all
+        of the location's contents, so results have to be filtered to the
+        candidates.
+
+        Args:
+            candidates (list): The search candidates.
+
+        Returns:
+            list: The `SearchIndex` objects.
+
+        """
+        indexes = {}
+        loose = []
+        for obj in candidates:
+            location = obj.location
+            if location is not None and hasattr(location, "get_search_index"):
+                if location not in indexes:
+                    indexes[location] = location.get_search_index()
+            else:
+                loose.append(obj)
+        indexes = list(indexes.values())
+        if loose:
+            indexes.append(SearchIndex(loose))
+        return indexes
+
+    def search_many(self, searchdata_list, **kwargs):
+        """
+        Search for several names at once, e.g. the receivers of a whisper.
+
+        Works like calling `search` for every name, including the error messages
+        for no or multiple matches, but the search candidates are collected only
+        once and exact matches are looked up in the search indexes of their
+        locations (see `get_search_index`). Names without an exact match fall
+        back to `search` on the same candidates.
+
+        Args:
+            searchdata_list (iterable of str): The names to search for.
+            **kwargs: Same as for `search` (`location`, `quiet`, `use_locks`, ...).
+
+        Returns:
+            list: One result per name, in order. What `search` would return for
+                the name (None if nothing or more than one match was found).
+
+        """
+        searchdata_list = list(searchdata_list)
+        candidates = kwargs.pop("candidates", None)
+        if candidates is None and not kwargs.get("global_search"):
+            candidates = self.get_search_candidates(None, **kwargs)
+        if candidates is None:
+            # global search: nothing to share
+            return [self.search(searchdata, **kwargs) for searchdata in searchdata_list]
+
+        candidates = list(candidates)
+        candidate_set = set(candidates)
+        indexes = self._get_search_indexes(candidates)
+
+        use_locks = kwargs.get("use_locks", True)
+        results = []
+        for searchdata in searchdata_list:
+            searchdata = self.get_search_query_replacement(searchdata, **kwargs)
+            should_return, match = self.get_search_direct_match(
+                searchdata, candidates=candidates, **kwargs
+            )
+            if should_return:
+                results.append(match)
+                continue
+            matches = [
+                obj for index in indexes for obj in index.exact(searchdata) if obj in candidate_set
+            ]
+            matches.sort(key=lambda obj: obj.id)
+            if use_locks and matches:
+                matches = [obj for obj in matches if obj.access(self, "search", default=True)]
+            if not matches:
+                results.append(self.search(searchdata, candidates=candidates, **kwargs))
+                continue
+            results.append(self.handle_search_results(searchdata, matches, **kwargs))
+        return results
+
+    def get_noun_forms(self):
+        """
+        Returns the grammatical forms of the object's name, cached in memory.
+
+        The forms are read once from the "gender" tag and the "plural" and
+        "accusative" attributes and kept until the object is renamed or one of
+        them changes (see `at_tags_change` and `at_attribute_change`).
+
+        Returns:
+            tuple: `(gender, plural, accusative)`. `plural` and `accusative` are None
+                if they are not stored (i.e. the same as the key).
+
+        """
+        name = self.name
+        forms = self.ndb.noun_forms
+        if forms is None or forms[0] != name:
+            self_tags = cast(TagHandler, self.tags)
+            gender = (self_tags.get(category="gender", return_list=True) or ["n"])[0]
+            self_attributes = cast(AttributeHandler, self.attributes)
+            plural = self_attributes.get("plural", default=None)
+            accusative = self_attributes.get("accusative", default=None)
+            forms = (name, gender, plural, accusative)
+            self.ndb.noun_forms = forms
+        return forms[1:]
+
+    def set_noun_forms(self, gender=None, plural=None, accusative=None):
+        """
+        Store the grammatical forms of the object's name. The tag and attribute
+        handlers drop the cached forms.
+
+        Args:
+            gender (str, optional): "m", "f" or "n".
+            plural (str, optional): Plural of the key.
+            accusative (str, optional): Accusative singular of the key.
+
+        """
+        if gender:
+            self_tags = cast(TagHandler, self.tags)
+            self_tags.clear(category="gender")
+            self_tags.add(gender, category="gender")
+        self_attributes = cast(AttributeHandler, self.attributes)
+        if plural:
+            self_attributes.add("plural", plural)
+        if accusative:
+            self_attributes.add("accusative", accusative)
+
+    def clear_noun_forms(self):
+        """
+        Forget the cached noun forms and tell the location about the change.
+
+        """
+        self.ndb.noun_forms = None
+        self.update_in_location()
+
+    def update_in_location(self):
+        """
+        Tell the location that the way this object is named or found changed, so
+        it updates its search index and drops the cached appearance.
+
+        """
+        location = self.location
+        if location and hasattr(location, "at_contents_change"):
+            location.at_contents_change(changed=self)
+
+    def at_tags_change(self, tagtype, category):
+        """
+        Called by the tag and alias handlers after tags or aliases were added,
+        removed or cleared.
+
+        Args:
+            tagtype (str or None): "alias" for aliases, None for tags.
+            category (str or None): Category of the changed tags.
+
+        """
+        if tagtype == "alias":
+            # aliases are in the search index of the location
+            self.update_in_location()
+        elif category == "gender":
+            self.clear_noun_forms()
+
+    def at_attribute_change(self, key, category):
+        """
+        Called by the attribute handler after Attributes were added or removed.
+
+        Args:
+            key (str or None): Key of the changed Attribute, None if all Attributes
+                (of `category`) were removed.
+            category (str or None): Category of the changed Attribute.
+
+        """
+        # a direct write wins over a buffered value (see `world.statstore`)
+        discard_pending(self, key, category)
+        if category is not None:
+            return
+        if key in (None, "plural", "accusative"):
+            self.clear_noun_forms()
+        if key in (None, "color_code"):
+            self.ndb.display_names = None
+            # the room shows the old color in its cached appearance
+            self.update_in_location()
+
     @override
     def get_numbered_name(self, count, looker, **kwargs):
         """
@@ -99,25 +591,24 @@ class ObjectParent(DefaultObject):
         default case "nominative" is just the key
 
         definite_article=True for definite article. Else default indefinite article
+
+        The noun forms are cached by `get_noun_forms` and the articles come from the
+        precomputed tables in `world.declension`. The plural and article forms are
+        searchable via `get_search_index`.
         """
 
         # TODO: add object tag "unique" that always leads to definit article
 
         key = kwargs.get("key", self.name)
-        article_type = "def" if kwargs.get("definite_article") else "indef"
+        definite = bool(kwargs.get("definite_article"))
         case = kwargs.get("case", "nominative")
 
-        self_tags = cast(TagHandler, self.tags)
-        gender = (self_tags.get(category="gender") or ["n"])[0]
-
-        # Retrieve custom attribute "plural"
-        self_attributes = cast(AttributeHandler, self.attributes)
-        plural = self_attributes.get("plural", default=key)
+        gender, plural, accusative = self.get_noun_forms()
+        plural = plural or key
 
-        if self_attributes.has(case):
-            if case == "accusative" and count == 1:
-                # use accusative for singular
-                key = self_attributes.get(case)
+        if accusative and case == "accusative" and count == 1:
+            # use accusative for singular
+            key = accusative
         # TODO: handle plural cases for "dative" and "genitive" (accusative plural = nominative plural)
 
         if kwargs.get("no_article") and count == 1:
@@ -127,71 +618,13 @@ class ObjectParent(DefaultObject):
                 return key if count == 1 else plural
             return key, plural
 
-        articles = {
-            "nominative": {
-                "m": {"indef": "ein", "def": "der"},
-                "f": {"indef": "eine", "def": "die"},
-                "n": {"indef": "ein", "def": "das"},
-                "pl": {"indef": "", "def": "die "},
-            },
-            "accusative": {
-                "m": {"indef": "einen", "def": "den"},
-                "f": {"indef": "eine", "def": "die"},
-                "n": {"indef": "ein", "def": "das"},
-                "pl": {"indef": "", "def": "die "},
-            },
-            "dative": {
-                "m": {"indef": "einem", "def": "dem"},
-                "f": {"indef": "einer", "def": "der"},
-                "n": {"indef": "einem", "def": "dem"},
-                "pl": {"indef": "", "def": "den "},
-            },
-            "genitive": {
-                "m": {"indef": "eines", "def": "des"},
-                "f": {"indef": "einer", "def": "der"},
-                "n": {"indef": "eines", "def": "des"},
-                "pl": {"indef": "", "def": "der "},
-            },
-        }
-
-        case_dict = articles.get(case, articles["nominative"])
-        article_singular = case_dict.get(gender, case_dict["n"]).get(article_type, "ein")
-
-        num = ""
+        article_singular = singular_article(case, gender, definite)
         # if count == 0:
-        #     article_plural = "k" + articles.get(case, "nominative").get(gender, "n").get("indef")
-        #     # ein -> kein, eine -> keine TODO: not working because it adds plural noun
-        if count == 1:
-            article_plural = article_singular
-        else:
-            match count:
-                case count if count in range(2, 12 + 1):
-                    num = {
-                        2: "zwei",
-                        3: "drei",
-                        4: "vier",
-                        5: "fünf",
-                        6: "sechs",
-                        7: "sieben",
-                        8: "acht",
-                        9: "neun",
-                        10: "zehn",
-                        11: "elf",
-                        12: "zwölf",
-                    }.get(count)
-                case _:
-                    num = count
-
-            article_plural = "{}{}".format(case_dict["pl"].get(article_type, "die"), num)
-
-        # update aliases
-        # plural (without article)
-        self_aliases = cast(AliasHandler, self.aliases)
-        self_aliases.add(plural, category=self.plural_category)
-        # self.aliases.add(plural, category=self.plural_category)
-        # singular (with article)
-        self_aliases.add(f"{article_singular} {key}", category=self.plural_category)
-        # self.aliases.add(f"{article_singular} {key}", category=self.plural_category)
+        #     ein -> kein, eine -> keine TODO: not working because it adds plural noun
+        article_plural = numbered_article(count, case, gender, definite)
+
+        # no aliases are stored for the plural and article forms, local searches
+        # find them through the search index of the location (see `get_search_index`)
 
         # format strings with color formatting of the noun via get_display_name
         singular = f"{article_singular} {self.get_display_name(looker, key=key)}"
@@ -203,14 +636,267 @@ class ObjectParent(DefaultObject):
         return singular, plural
 
     @override
-    def get_display_exits(self, looker, **kwargs):
+    def return_appearance(self, looker, **kwargs):
         """
-        Get the 'exits' component of the object description. Called by `return_appearance`.
+        Main callback used by 'look' for the object to describe itself.
+
+        Overwrite: `get_display_exits`, `get_display_characters` and
+        `get_display_things` share one `get_display_contents` result per call.
+
+        """
+        self.ndb.appearance_call = {}
+        try:
+            return super().return_appearance(looker, **kwargs)
+        finally:
+            self.ndb.appearance_call = None
+
+    def get_display_contents(self, looker, **kwargs):
+        """
+        Get the 'exits', 'characters' and 'things' components of the object description
+        in one pass. Used by `get_display_exits`, `get_display_characters` and
+        `get_display_things`, which share the result within one `return_appearance`.
+
+        The view locks are checked on every look, so changed locks or tags of the
+        looker take effect at once. The formatted sections are cached for the last
+        `APPEARANCE_CACHE_SIZE` lookers and reused as long as the same objects are
+        visible and the contents did not change (see `at_contents_change`). Calls
+        with extra kwargs are not cached.
 
         Args:
             looker (DefaultObject): Object doing the looking.
             **kwargs: Arbitrary data for use when overriding.
 
+        Returns:
+            dict: `{"exits": str, "characters": str, "things": str}`
+
+        """
+        current_call = self.ndb.appearance_call
+        if current_call is not None and looker in current_call:
+            return current_call[looker]
+
+        # every content object is checked against the view lock exactly once
+        visible = {
+            content_type: self.filter_visible(
+                self.contents_get(content_type=content_type), looker, **kwargs
+            )
+            for content_type in ("exit", "character", "object")
+        }
+        cache_key = None if kwargs else looker
+        visible_key = tuple(tuple(objs) for objs in visible.values())
+        cache = self.ndb.appearance_cache
+        if cache is None:
+            cache = self.ndb.appearance_cache = {}
+        sections = None
+        if cache_key is not None and cache_key in cache:
+            # most recently used lookers last
+            cached_visible, cached_sections = cache.pop(cache_key)
+            if cached_visible == visible_key:
+                sections = cached_sections
+
+        if sections is None:
+            sections = {
+                "exits": self.format_display_exits(visible["exit"], looker, **kwargs),
+                "characters": self.format_display_characters(
+                    visible["character"], looker, **kwargs
+                ),
+                "things": self.format_display_things(visible["object"], looker, **kwargs),
+            }
+        if cache_key is not None:
+            cache[cache_key] = (visible_key, sections)
+            if len(cache) > APPEARANCE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        if current_call is not None:
+            current_call[looker] = sections
+        return sections
+
+    def at_contents_change(self, added=None, removed=None, changed=None, weight_change=0):
+        """
+        Called whenever the contents of this object changed. Updates or drops
+        everything cached about the contents.
+
+        Args:
+            added (DefaultObject, optional): Object that entered this object.
+            removed (DefaultObject, optional): Object that left this object.
+            changed (DefaultObject, optional): Object inside this object that changed
+                (e.g. renamed or a stack that changed its quantity).
+            weight_change (float, optional): How much the `gross_weight` of `changed`
+                changed (e.g. for a new quantity), 0 for changes of the name.
+
+        Notes:
+            Called without arguments if it is not known what changed, e.g. when an
+            object was created inside this object. Caches that can't be updated
+            incrementally then have to be rebuilt.
+
+        """
+        self.ndb.appearance_cache = None
+
+        exit_index = self.ndb.exit_index
+        if exit_index is not None:
+            if added:
+                if added.destination:
+                    exit_index.add(added)
+            elif removed:
+                exit_index.discard(removed)
+            elif changed:
+                # e.g. re-linked, see `destination`
+                if changed.destination:
+                    exit_index.add(changed)
+                else:
+                    exit_index.discard(changed)
+            else:
+                self.ndb.exit_index = None
+
+        index = self.ndb.search_index
+        if index is not None:
+            if added:
+                index.add(added)
+            elif removed:
+                index.remove(removed)
+            elif changed:
+                if changed in index:
+                    index.add(changed)
+            else:
+                self.ndb.search_index = None
+
+        occupants = self.ndb.occupants
+        if occupants is not None:
+            if added:
+                if added.sessions.count():
+                    occupants.add(added)
+            elif removed:
+                occupants.discard(removed)
+            elif not changed:
+                self.ndb.occupants = None
+
+        # running weight totals of this object and everything it is in
+        if added:
+            self.adjust_carried_weight(added.gross_weight)
+        elif removed:
+            self.adjust_carried_weight(-removed.gross_weight)
+        elif changed:
+            if weight_change:
+                self.adjust_carried_weight(weight_change)
+        else:
+            self.adjust_carried_weight(None)
+
+    @property
+    def carried_weight(self):
+        """
+        Total weight of everything inside this object, including the contents of
+        containers inside it.
+
+        Computed from `contents` on first use and then kept up to date by
+        `at_contents_change`.
+
+        """
+        weight = self.ndb.carried_weight
+        if weight is None:
+            weight = self.ndb.carried_weight = sum(obj.gross_weight for obj in self.contents)
+        return weight
+
+    @property
+    def gross_weight(self):
+        """
+        Weight of this object including everything inside it.
+
+        """
+        return getattr(self, "total_weight", 0) + self.carried_weight
+
+    def adjust_carried_weight(self, delta):
+        """
+        Update the running weight totals of this object and everything it is inside
+        of (character -> chest -> bag). Only totals that were already computed are
+        touched, so this is O(depth).
+
+        Args:
+            delta (float or None): Weight change, or None if unknown (the totals are
+                dropped and computed again on next use).
+
+        """
+        obj = self
+        while obj:
+            if obj.ndb.carried_weight is not None:
+                obj.ndb.carried_weight = None if delta is None else obj.ndb.carried_weight + delta
+            obj = obj.location
+
+    def get_search_index(self):
+        """
+        Get the in-memory search index of the contents of this object.
+
+        The index is built on first use and kept up to date by
+        `at_contents_change`. It is used by `get_search_result` for all local
+        searches.
+
+        Returns:
+            SearchIndex: The index.
+
+        """
+        index = self.ndb.search_index
+        if index is None:
+            index = self.ndb.search_index = SearchIndex(self.contents)
+        return index
+
+    def get_occupants(self):
+        """
+        Get the objects inside this object that are puppeted by a connected account,
+        e.g. the players in a room.
+
+        Built from `contents` on first use and then kept up to date on moves
+        (`at_contents_change`), puppet and unpuppet (`update_occupant`).
+
+        Returns:
+            OccupantSet: The occupants.
+
+        """
+        occupants = self.ndb.occupants
+        if occupants is None:
+            occupants = self.ndb.occupants = OccupantSet(
+                obj for obj in self.contents if obj.sessions.count()
+            )
+        return occupants
+
+    def update_occupant(self, obj):
+        """
+        Add `obj` to or remove it from the occupants, depending on whether it is
+        inside this object and has a connected session.
+
+        """
+        occupants = self.ndb.occupants
+        if occupants is None:
+            return
+        if obj.location is self and obj.sessions.count():
+            occupants.add(obj)
+        else:
+            occupants.discard(obj)
+
+    def get_exits_to(self, destination):
+        """
+        Get the exits inside this object that lead to `destination`.
+
+        Uses an index from destination to exits that is built from the exits in
+        `contents` on first use and then kept up to date by `at_contents_change`
+        (exits moving in or out, and re-linked exits, see `destination`).
+
+        Args:
+            destination (DefaultObject): The place the exits lead to.
+
+        Returns:
+            list: The exits (usually zero or one).
+
+        """
+        index = self.ndb.exit_index
+        if index is None:
+            index = self.ndb.exit_index = ExitIndex(self.contents_get(content_type="exit"))
+        return index.get(destination)
+
+    def format_display_exits(self, exits, looker, **kwargs):
+        """
+        Format the 'exits' component of the object description.
+
+        Args:
+            exits (list): Visible exits.
+            looker (DefaultObject): Object doing the looking.
+
         Keyword Args:
             exit_order (iterable of str): The order in which exits should be listed, with
                 unspecified exits appearing at the end, alphabetically.
@@ -218,12 +904,6 @@ class ObjectParent(DefaultObject):
         Returns:
             str: The exits display data.
 
-        Examples:
-        ::
-
-            For a room with exits in the order 'portal', 'south', 'north', and 'out':
-                obj.get_display_name(looker, exit_order=('north', 'south'))
-                    -> "Exits: north, south, out, and portal."  (markup not shown here)
         """
 
         def _sort_exit_names(names):
@@ -236,7 +916,6 @@ class ObjectParent(DefaultObject):
             names.sort(key=lambda name: sort_index.get(name, end_pos))
             return names
 
-        exits = self.filter_visible(self.contents_get(content_type="exit"), looker, **kwargs)
         exit_names = (exi.get_display_name(looker, **kwargs) for exi in exits)
         exit_names = iter_to_str(
             _sort_exit_names(exit_names), endsep=_("und")
@@ -246,21 +925,18 @@ class ObjectParent(DefaultObject):
             _("|wAusgänge:|n {e}").format(e=exit_names) if exit_names else ""
         )  # TODO: Pull-Request for i18
 
-    @override
-    def get_display_characters(self, looker, **kwargs):
+    def format_display_characters(self, characters, looker, **kwargs):
         """
-        Get the 'characters' component of the object description. Called by `return_appearance`.
+        Format the 'characters' component of the object description.
 
         Args:
+            characters (list): Visible characters.
             looker (DefaultObject): Object doing the looking.
-            **kwargs: Arbitrary data for use when overriding.
+
         Returns:
             str: The character display data.
 
         """
-        characters = self.filter_visible(
-            self.contents_get(content_type="character"), looker, **kwargs
-        )
         character_names = iter_to_str(
             (char.get_display_name(looker, **kwargs) for char in characters),
             endsep=_("und"),  # TODO: Pull-Request for i18
@@ -270,28 +946,27 @@ class ObjectParent(DefaultObject):
             _("|wCharaktere:|n {c}").format(c=character_names) if character_names else ""
         )  # TODO: Pull-Request for i18
 
-    @override
-    def get_display_things(self, looker, **kwargs):
+    def format_display_things(self, things, looker, **kwargs):
         """
-        Get the 'things' component of the object description. Called by `return_appearance`.
+        Format the 'things' component of the object description. Things with the
+        same display name are grouped and shown with a numbered name.
 
         Args:
+            things (list): Visible things.
             looker (DefaultObject): Object doing the looking.
-            **kwargs: Arbitrary data for use when overriding.
+
         Returns:
             str: The things display data.
 
         """
         # sort and handle same-named things
-        things = self.filter_visible(self.contents_get(content_type="object"), looker, **kwargs)
-
         grouped_things = defaultdict(list)
         for thing in things:
             grouped_things[thing.get_display_name(looker, **kwargs)].append(thing)
 
         thing_names = []
         for thingname, thinglist in sorted(grouped_things.items()):
-            nthings = len(thinglist)
+            nthings = sum(thing.quantity for thing in thinglist)
             thing = thinglist[0]
             singular, plural = thing.get_numbered_name(nthings, looker, case="accusative")
             thing_names.append(singular if nthings == 1 else plural)
@@ -306,6 +981,248 @@ class ObjectParent(DefaultObject):
             else ""
         )
 
+    @override
+    def get_display_exits(self, looker, **kwargs):
+        """
+        Get the 'exits' component of the object description. Called by `return_appearance`.
+
+        Args:
+            looker (DefaultObject): Object doing the looking.
+            **kwargs: Arbitrary data for use when overriding.
+
+        Keyword Args:
+            exit_order (iterable of str): The order in which exits should be listed, with
+                unspecified exits appearing at the end, alphabetically.
+
+        Returns:
+            str: The exits display data.
+
+        Examples:
+        ::
+
+            For a room with exits in the order 'portal', 'south', 'north', and 'out':
+                obj.get_display_name(looker, exit_order=('north', 'south'))
+                    -> "Exits: north, south, out, and portal."  (markup not shown here)
+        """
+        return self.get_display_contents(looker, **kwargs)["exits"]
+
+    @override
+    def get_display_characters(self, looker, **kwargs):
+        """
+        Get the 'characters' component of the object description. Called by `return_appearance`.
+
+        Args:
+            looker (DefaultObject): Object doing the looking.
+            **kwargs: Arbitrary data for use when overriding.
+        Returns:
+            str: The character display data.
+
+        """
+        return self.get_display_contents(looker, **kwargs)["characters"]
+
+    @override
+    def get_display_things(self, looker, **kwargs):
+        """
+        Get the 'things' component of the object description. Called by `return_appearance`.
+
+        Args:
+            looker (DefaultObject): Object doing the looking.
+            **kwargs: Arbitrary data for use when overriding.
+        Returns:
+            str: The things display data.
+
+        """
+        return self.get_display_contents(looker, **kwargs)["things"]
+
+    @property
+    def destination(self):
+        return ObjectDB.destination.fget(self)
+
+    @destination.setter
+    def destination(self, destination):
+        # tells the location to re-key its exit index (e.g. after `link`)
+        ObjectDB.destination.fset(self, destination)
+        self.update_in_location()
+
+    @destination.deleter
+    def destination(self):
+        ObjectDB.destination.fdel(self)
+        self.update_in_location()
+
+    @override
+    def at_object_creation(self):
+        super().at_object_creation()
+        location = self.location
+        if (
+            location
+            and hasattr(location, "at_contents_change")
+            and not location.ndb.creating_quietly
+        ):
+            # Attributes like "plural" or "weight" are only set after creation, so
+            # don't pass the new object as `added`. Code that tells the location
+            # itself once the object is complete (e.g. `Item.split_stack`) sets
+            # `creating_quietly` on the location to skip this.
+            location.at_contents_change()
+
+    @override
+    def at_object_delete(self):
+        location = self.location
+        if location and hasattr(location, "at_contents_change"):
+            location.at_contents_change(removed=self)
+        return super().at_object_delete()
+
+    @override
+    def at_post_puppet(self, **kwargs):
+        super().at_post_puppet(**kwargs)
+        location = self.location
+        if location and hasattr(location, "update_occupant"):
+            location.update_occupant(self)
+
+    @override
+    def at_post_unpuppet(self, account=None, session=None, **kwargs):
+        # characters are moved out of the room (without hooks) when the last session leaves
+        location = self.location
+        super().at_post_unpuppet(account=account, session=session, **kwargs)
+        if not location or not hasattr(location, "at_contents_change"):
+            return
+        if self.location is None:
+            # stowed away: the room has to forget it like after a move
+            location.at_contents_change(removed=self)
+        else:
+            location.update_occupant(self)
+
+    @override
+    def at_object_receive(self, moved_obj, source_location, move_type="move", **kwargs):
+        super().at_object_receive(moved_obj, source_location, move_type=move_type, **kwargs)
+        self.at_contents_change(added=moved_obj)
+
+    @override
+    def at_object_leave(self, moved_obj, target_location, move_type="move", **kwargs):
+        super().at_object_leave(moved_obj, target_location, move_type=move_type, **kwargs)
+        self.at_contents_change(removed=moved_obj)
+
+    @classmethod
+    def bulk_move_to(cls, objs, destination, quiet=True, move_type="move", **kwargs):
+        """
+        Move many objects to `destination` at once, e.g. a stack of items in `nimm 50 Holz`.
+
+        Works like calling `obj.move_to(destination)` for every object, but the
+        `db_location` of all objects is written with a single UPDATE inside one
+        transaction. The pre-move hooks (`at_pre_move`, `at_pre_object_leave`,
+        `at_pre_object_receive`) are called for the whole batch first; objects
+        failing them are skipped. As in `move_to`, `at_object_leave` of the source
+        is called before the location changes, `at_object_receive` and
+        `at_post_move` after the commit.
+
+        Args:
+            objs (iterable): The objects to move.
+            destination (DefaultObject): Where to move them.
+            quiet (bool): If False, call `announce_move_from`/`announce_move_to`.
+            move_type (str): The type of move, passed on to the hooks ("get", "drop", ...).
+            **kwargs: Passed on to the hooks.
+
+        Returns:
+            list: The objects that were moved.
+
+        """
+        # can't move an object into itself or into something it contains
+        ancestors = set()
+        loc = destination
+        while loc:
+            ancestors.add(loc)
+            loc = loc.location
+
+        movable = []
+        for obj in objs:
+            if obj in ancestors or obj.location is destination:
+                continue
+            source_location = obj.location
+            if not obj.at_pre_move(destination, move_type=move_type, **kwargs):
+                continue
+            if source_location and not source_location.at_pre_object_leave(
+                obj, destination, move_type=move_type, **kwargs
+            ):
+                continue
+            if not destination.at_pre_object_receive(
+                obj, source_location, move_type=move_type, **kwargs
+            ):
+                continue
+            movable.append((obj, source_location))
+
+        if not movable:
+            return []
+
+        # like move_to, the source is told before the location changes
+        for obj, source_location in movable:
+            if source_location:
+                source_location.at_object_leave(obj, destination, move_type=move_type, **kwargs)
+            if not quiet:
+                obj.announce_move_from(destination, move_type=move_type, **kwargs)
+
+        with transaction.atomic():
+            ObjectDB.objects.filter(pk__in=[obj.pk for obj, _source in movable]).update(
+                db_location=destination
+            )
+
+        # bring the cached instances and contents caches in line with the database
+        for obj, source_location in movable:
+            obj.db_location = destination
+            if source_location:
+                source_location.contents_cache.remove(obj)
+            destination.contents_cache.add(obj)
+
+        for obj, source_location in movable:
+            if not quiet:
+                obj.announce_move_to(source_location, move_type=move_type, **kwargs)
+            destination.at_object_receive(obj, source_location, move_type=move_type, **kwargs)
+            obj.at_post_move(source_location, move_type=move_type, **kwargs)
+
+        return [obj for obj, _source in movable]
+
+    def broadcast(self, message, exclude=None, from_obj=None, mapping=None, **kwargs):
+        """
+        Send a message to everyone inside this object, e.g. an action announcement
+        in a room. A cheaper `msg_contents` for crowded locations.
+
+        Only the occupants (objects with a connected session, see `get_occupants`)
+        get the message. The objects in `mapping` are rendered
+        with `get_display_name(receiver)` and callables are called with the
+        receiver. Receivers seeing the same rendering are grouped and `message` is
+        formatted only once per group.
+
+        Args:
+            message (str): The message, with `{key}` markers for `mapping`.
+            exclude (DefaultObject or list, optional): Objects not to message.
+            from_obj (DefaultObject, optional): Sender of the message.
+            mapping (dict, optional): Values for the markers in `message`. Values with a
+                `get_display_name` method and callables (`callable(receiver)`, e.g.
+                for `get_numbered_name`) are rendered per receiver.
+            **kwargs: Passed on to `msg` of each receiver.
+
+        """
+        exclude = make_iter(exclude) if exclude else ()
+        mapping = mapping or {}
+        viewer_dependent = {
+            key: value
+            for key, value in mapping.items()
+            if callable(value) or hasattr(value, "get_display_name")
+        }
+
+        groups = defaultdict(list)
+        for receiver in self.get_occupants():
+            if receiver in exclude:
+                continue
+            rendering = tuple(
+                (key, value(receiver) if callable(value) else value.get_display_name(receiver))
+                for key, value in viewer_dependent.items()
+            )
+            groups[rendering].append(receiver)
+
+        for rendering, receivers in groups.items():
+            text = message.format_map({**mapping, **dict(rendering)})
+            for receiver in receivers:
+                receiver.msg(text=text, from_obj=from_obj, **kwargs)
+
     @override
     def announce_move_from(self, destination, msg=None, mapping=None, move_type="move", **kwargs):
         """
@@ -346,9 +1263,7 @@ class ObjectParent(DefaultObject):
             )  # TODO: Pull-Request for i18
 
         location = self.location
-        exits = [
-            o for o in location.contents if o.location is location and o.destination is destination
-        ]
+        exits = location.get_exits_to(destination) if destination else []
         if not mapping:
             mapping = {}
 
@@ -447,8 +1362,7 @@ class ObjectParent(DefaultObject):
             msg_receivers = msg_receivers or message
 
         custom_mapping = kwargs.get("mapping", {})
-        if receivers:
-            receivers = cast(Iterable[Self], make_iter(receivers))
+        receivers = cast(list[Self], list(make_iter(receivers))) if receivers else []
         location = cast(ObjectDB, self.location)
 
         if msg_self:
@@ -471,33 +1385,25 @@ class ObjectParent(DefaultObject):
             )
 
         if receivers and msg_receivers:
+            # the same for every receiver, so only computed once
             receiver_mapping = {
                 "self": _("Du"),  # TODO: Pull-Request for i18n
-                "object": None,
-                "location": None,
-                "receiver": None,
-                "all_receivers": None,
+                "all_receivers": ", ".join(recv.get_display_name(recv) for recv in receivers),
                 "speech": message,
             }
+            receiver_mapping.update(custom_mapping)
+            # depend on the receiver, only computed if used in msg_receivers
+            viewer_fields = {
+                "object": self.get_display_name,
+                "location": lambda viewer: (
+                    location.get_display_name(viewer) if location else None
+                ),
+                "receiver": lambda viewer: viewer.get_display_name(viewer),
+            }
             for receiver in receivers:
-                receiver: Object
-                individual_mapping = {
-                    "object": self.get_display_name(receiver),
-                    "location": location.get_display_name(receiver),
-                    "receiver": receiver.get_display_name(receiver),
-                    "all_receivers": (
-                        ", ".join(recv.get_display_name(recv) for recv in receivers)
-                        if receivers
-                        else None
-                    ),
-                }
-                receiver_mapping.update(individual_mapping)
-                receiver_mapping.update(custom_mapping)
+                individual_mapping = ViewerMapping(receiver_mapping, viewer_fields, receiver)
                 receiver.msg(
-                    text=(
-                        msg_receivers.format_map(receiver_mapping),
-                        {"type": msg_type},
-                    ),
+                    text=(msg_receivers.format_map(individual_mapping), {"type": msg_type}),
                     from_obj=self,
                 )
 
@@ -538,10 +1444,13 @@ class ObjectParent(DefaultObject):
 
         # Clear plural aliases set by DefaultObject.get_numbered_name
         cast(AliasHandler, self.aliases).clear(category=self.plural_category)
+        self.ndb.display_names = None
         # Clear plural and accusative attributes
         self_attributes = cast(AttributeHandler, self.attributes)
         self_attributes.remove("plural")
         self_attributes.remove("accusative")
+        # tells the location about the new name (appearance and search index)
+        self.clear_noun_forms()
         # probably same gender, so keep that for now
         # self.attributes.remove("gender")
 
@@ -742,5 +1651,58 @@ class Object(ObjectParent, DefaultObject):
     @override
     def at_object_creation(self):
         super().at_object_creation()
-        for obj_type in self.obj_type:
-            cast(TagHandler, self.tags).add(obj_type.value, category="obj_type")
+        self.add_obj_type_tags()
+
+    def add_obj_type_tags(self):
+        """
+        Tag the object with its `obj_type`s (category "obj_type").
+
+        `TagHandler.add` links every tag with its own query, so the Tag rows are
+        fetched (or created) together and linked with a single `db_tags.add`.
+        Types already in the tags passed to `create_object` or
+        `batch_create_object` (e.g. by `world.spawner`) are skipped, those tags
+        are added after this hook.
+
+        """
+        pending = set()
+        for tag in (getattr(self, "_createdict", None) or {}).get("tags") or ():
+            tag = make_iter(tag)
+            if len(tag) > 1 and tag[1] == "obj_type":
+                pending.add(str(tag[0]).lower())
+        keys = {obj_type.value.lower() for obj_type in self.obj_type} - pending
+        if not keys:
+            return
+        tag_model = self.__dbclass__.__name__.lower()
+        tags = list(
+            Tag.objects.filter(
+                db_key__in=keys, db_category="obj_type", db_model=tag_model, db_tagtype=None
+            )
+        )
+        for key in keys - {tag.db_key for tag in tags}:
+            tags.append(
+                Tag.objects.create(
+                    db_key=key, db_category="obj_type", db_model=tag_model, db_tagtype=None
+                )
+            )
+        self.db_tags.add(*tags)
+        # the handler caches the tags, let it read them again
+        cast(TagHandler, self.tags).reset_cache()
+
+
+def objects_of_type(obj_type: ObjectType, location=None):
+    """
+    Get all objects of a type (see `Object.obj_type`), using the indexed obj_type tags.
+
+    Args:
+        obj_type (ObjectType): The type, e.g. `ObjectType.WEAPON`.
+        location (DefaultObject, optional): Only objects in this location.
+
+    Returns:
+        QuerySet: The objects. Nothing is loaded until it is evaluated, so
+            e.g. `.count()` or `.exists()` only run one query.
+
+    """
+    query = ObjectDB.objects.get_by_tag(key=obj_type.value, category="obj_type")
+    if location is not None:
+        query = query.filter(db_location=location)
+    return query
@@ -1,13 +1,203 @@
+import re
+from typing import cast, override
+from evennia.locks.lockhandler import LockHandler
+from evennia.objects.models import ObjectDB
+from evennia.typeclasses.tags import TagHandler
+from evennia.utils.utils import delay
+from twisted.internet import reactor
 from .objects import Object
 
+# lock strings of the form "<access_type>: perm(<perm>) or id(<owner id>)" (see set_owner)
+OWNER_LOCK_REGEX = re.compile(r"^\s*(?:\w+\s*:)?\s*perm\(\w+\)\s+or\s+id\((\d+)\)\s*$")
+
+# compiled owner locks: lock string -> owner id (None if the lock string has another form)
+_OWNER_LOCK_CACHE: dict[str, int | None] = {}
+
+
+def compile_owner_lock(lockstring):
+    """
+    Get the owner id from an ownership lock string, cached per lock string.
+
+    Args:
+        lockstring (str): A lock string like "get_from: perm(Admin) or id(42)".
+
+    Returns:
+        int or None: The owner id, or None if the lock string has another form.
+
+    """
+    try:
+        return _OWNER_LOCK_CACHE[lockstring]
+    except KeyError:
+        match = OWNER_LOCK_REGEX.match(lockstring or "")
+        owner_id = _OWNER_LOCK_CACHE[lockstring] = int(match.group(1)) if match else None
+        return owner_id
+
+
+# compiled locks: lock string -> evaluator(accessing_obj, obj), see `compile_lock`
+_LOCK_CACHE = {}
+
+# lock functions that only depend on the accessing object and their arguments
+MEMOIZED_LOCKFUNCS = {"perm", "perm_above", "pperm", "pperm_above"}
+
+# (accessing object, lock function, args, kwargs) -> result, see `_check_lockfunc`
+_LOCKFUNC_MEMO = {}
+
+
+def _check_lockfunc(check, accessing_obj, obj):
+    """
+    Call one lock function of a parsed lock. Permission checks are memoized for
+    the current request: the memo is cleared once the reactor is done with the
+    running command, so e.g. looking into dozens of chests checks the
+    permissions of the looker only once. Without a running reactor (evennia
+    shell, scripts) nothing would clear the memo, so nothing is memoized.
+
+    """
+    func, args, kwargs = check
+    if func.__name__ not in MEMOIZED_LOCKFUNCS or not reactor.running:
+        return bool(func(accessing_obj, obj, *args, **kwargs))
+    key = (accessing_obj, func.__name__, tuple(args), tuple(sorted(kwargs.items())))
+    try:
+        return _LOCKFUNC_MEMO[key]
+    except KeyError:
+        if not _LOCKFUNC_MEMO:
+            delay(0, _LOCKFUNC_MEMO.clear)
+        result = _LOCKFUNC_MEMO[key] = bool(func(accessing_obj, obj, *args, **kwargs))
+        return result
+
+
+def compile_lock(lockstring, evalstring, checks):
+    """
+    Compile a parsed lock into a Python function, cached per lock string.
+
+    The lock handler evaluates a lock by calling all its lock functions and then
+    `eval`ing the filled-in `evalstring` ("%s or %s") on every check. The
+    compiled function is built once and calls the lock functions lazily, so
+    `and`/`or` short-circuit.
+
+    Args:
+        lockstring (str): The raw lock string, e.g. "get_from: perm(Admin) or id(42)".
+        evalstring (str): The parsed evaluation string of the lock handler.
+        checks (tuple): The parsed `(lockfunc, args, kwargs)` of the lock handler.
+
+    Returns:
+        callable: `evaluator(accessing_obj, obj) -> bool`
+
+    """
+    try:
+        return _LOCK_CACHE[lockstring]
+    except KeyError:
+        pass
+    expression = evalstring % tuple(f"check({num})" for num in range(len(checks)))
+    evaluate = eval(f"lambda check: {expression}")
+
+    def evaluator(accessing_obj, obj):
+        return bool(evaluate(lambda num: _check_lockfunc(checks[num], accessing_obj, obj)))
+
+    _LOCK_CACHE[lockstring] = evaluator
+    return evaluator
+
+
+def owned_by(owner, location=None, typeclass=None):
+    """
+    Get all objects owned by `owner`, using the indexed owner tags.
+
+    Args:
+        owner (Object or int): The owner or its id.
+        location (Object, optional): Only objects in this location.
+        typeclass (class or str, optional): Only objects of this typeclass (no subclasses).
+
+    Returns:
+        QuerySet: The owned objects.
+
+    Example:
+        all containers owned by a character in a room:
+        `owned_by(character, location=room, typeclass=Container)`
+
+    """
+    owner_id = owner if isinstance(owner, int) else owner.id
+    query = ObjectDB.objects.get_by_tag(key=str(owner_id), category="owner")
+    if location is not None:
+        query = query.filter(db_location=location)
+    if typeclass is not None:
+        if not isinstance(typeclass, str):
+            typeclass = f"{typeclass.__module__}.{typeclass.__name__}"
+        query = query.filter(db_typeclass_path=typeclass)
+    return query
+
+
 class Ownable(Object):
     """
-    An Objec with a set_owner() method that can for example set locks on an object. 
+    An Objec with a set_owner() method that can for example set locks on an object.
     Gets called from the CmdGive with special switch `/eigentum`
+
+    The owner is stored as a tag (category "owner"), so it can be looked up
+    without parsing lock strings.
     """
 
     def set_owner(self, setter, target, **kwargs):
         """
         Set a new owner for this object.
         """
-        pass
+        self_tags = cast(TagHandler, self.tags)
+        self_tags.clear(category="owner")
+        self_tags.add(str(target.id), category="owner")
+
+    def get_owner_id(self):
+        """
+        Get the id of the owner of this object.
+
+        Returns:
+            int or None: The owner id, None if the object has no owner.
+
+        """
+        owner_id = cast(TagHandler, self.tags).get(category="owner")
+        return int(owner_id) if owner_id else None
+
+    def get_owner(self):
+        """
+        Get the owner of this object.
+
+        Returns:
+            Object or None: The owner, None if the object has no owner (or it was deleted).
+
+        """
+        owner_id = self.get_owner_id()
+        if owner_id is None:
+            return None
+        return ObjectDB.objects.filter(id=owner_id).first()
+
+    @override
+    def access(
+        self, accessing_obj, access_type="read", default=False, no_superuser_bypass=False, **kwargs
+    ):
+        """
+        Determines if another object has permission to access this one.
+
+        Overwrite: fast paths. If the lock for `access_type` is an ownership lock
+        "perm(...) or id(<owner>)" (see `set_owner`) and `accessing_obj` is the
+        owner, access is granted at once. Otherwise the lock is evaluated by its
+        compiled function (see `compile_lock`), for granted and denied access.
+        Only missing locks (`default`) and superusers (who bypass the locks) go
+        through the normal lock handler.
+
+        """
+        if accessing_obj is not None:
+            self_locks = cast(LockHandler, self.locks)
+            owner_id = compile_owner_lock(self_locks.get(access_type))
+            if owner_id is not None and accessing_obj.id == owner_id:
+                self.at_access(True, accessing_obj, access_type, **kwargs)
+                return True
+            lock = self_locks.locks.get(access_type)
+            bypass = not no_superuser_bypass and getattr(accessing_obj, "is_superuser", False)
+            if lock and not bypass:
+                evalstring, checks, lockstring = lock
+                result = compile_lock(lockstring, evalstring, checks)(accessing_obj, self)
+                self.at_access(result, accessing_obj, access_type, **kwargs)
+                return result
+        return super().access(
+            accessing_obj,
+            access_type=access_type,
+            default=default,
+            no_superuser_bypass=no_superuser_bypass,
+            **kwargs,
+        )
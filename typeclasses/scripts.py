@@ -16,6 +16,7 @@ import random
 from typing import cast, override
 from evennia.scripts.scripts import DefaultScript
 from evennia.typeclasses.attributes import AttributeProperty
+from world import ambient
 
 
 class Script(DefaultScript):
@@ -109,13 +110,15 @@ class Script(DefaultScript):
 class Pitchman(DefaultScript):
     """
     Sends messages to the contents of the location of it's object.
-    Default interval is 2 seconds.
+    Default interval is 2 seconds (self.tick_interval). The script has no timer of
+    its own, it is called by the shared ambient scheduler (see `world.ambient`)
+    and only while players are in the room.
     self.frequency is the probability for each interval to fire a message
 
     messages: List of messages
         can contain placeholders:
         - {obj} : the object the script is attached to
-        - {char}: a random character in the room
+        - {char}: a random (connected) player character in the room
 
     """
 
@@ -126,21 +129,48 @@ class Pitchman(DefaultScript):
         ]
     )
     weights = AttributeProperty([])
+    tick_interval = AttributeProperty(2)  # seconds
 
     def at_script_creation(self):
         self.key = "pitchman"
         self.desc = "sends messages to location contents"
-        self.interval = 2  # seconds
-        # self.repeats = 5  # repeat only a certain number of times
-        self.start_delay = True  # wait self.interval until first call
+        # no own timer, see at_start()
+        self.interval = 0
         # self.persistent = True
 
+    @override
+    def at_start(self, **kwargs):
+        if self.interval:
+            # created with an own timer before the ambient scheduler existed
+            self.interval = 0
+        ambient.register(self, self.tick_interval)
+
+    @override
+    def at_server_start(self, **kwargs):
+        # the ambient buckets only live in memory, register again after a reload
+        if self.is_active:
+            ambient.register(self, self.tick_interval)
+
+    @override
+    def at_pause(self, **kwargs):
+        ambient.unregister(self)
+
+    @override
+    def at_stop(self, **kwargs):
+        ambient.unregister(self)
+
     @override
     def at_repeat(self, **kwargs):
         """
         This gets called every self.interval seconds. We make
         a random check here so as to only return 33% of the time.
         """
+        location = self.obj.location
+        # dormant without players in the room
+        char = location.get_occupants().random_choice() if location else None
+        if char is None:
+            return
+
         if random.random() > cast(float, self.frequency):
             # no message this time
             return
@@ -154,12 +184,5 @@ class Pitchman(DefaultScript):
         else:
             message = random.choices(messages, weights)[0]
 
-        # look for characters in the room
-        chars = self.obj.search("", typeclass="typeclasses.characters.Character", quiet=True)
-        if len(chars) > 0:
-            char = random.choices(chars)[0].get_display_name()
-        else:
-            char = "Abenteurer"
-
-        message = message.format(obj=self.obj.get_display_name(), char=char)
-        self.obj.location.msg_contents(message)
+        # only to connected sessions, the names are rendered for each receiver
+        location.broadcast(message, mapping={"obj": self.obj, "char": char})
@@ -0,0 +1,103 @@
+"""
+Ambient Scheduler
+
+Shared timer for periodic ambient scripts (like `Pitchman`). Instead of one
+reactor timer per script, scripts are put into buckets by their interval and
+each bucket has one ticker (`TICKER_HANDLER`). On a tick all scripts of the
+bucket are handled in one pass and scripts in locations without a connected
+player are skipped.
+
+A script registers itself in `at_start` and unregisters in `at_stop`. Each
+tick calls its `at_repeat()`.
+
+```python
+    from world import ambient
+
+    class Barker(DefaultScript):
+        def at_start(self, **kwargs):
+            ambient.register(self, 5)
+
+        def at_stop(self, **kwargs):
+            ambient.unregister(self)
+```
+
+"""
+
+from evennia.scripts.tickerhandler import TICKER_HANDLER
+from evennia.utils import logger
+
+TICKER_IDSTRING = "ambient"
+
+# interval -> scripts
+_BUCKETS = {}
+# script -> interval
+_INTERVALS = {}
+
+
+def has_listeners(location):
+    """
+    Check if a location contains a puppeted object with a connected session.
+
+    """
+    if hasattr(location, "get_occupants"):
+        return bool(location.get_occupants())
+    return any(obj.sessions.count() for obj in location.contents if obj.has_account)
+
+
+def register(script, interval):
+    """
+    Call `script.at_repeat()` every `interval` seconds while there are players around.
+
+    Args:
+        script (Script): The script. Its `obj` is used to find the location.
+        interval (int): Seconds between two calls.
+
+    """
+    unregister(script)
+    bucket = _BUCKETS.get(interval)
+    if bucket is None:
+        bucket = _BUCKETS[interval] = set()
+        TICKER_HANDLER.add(
+            interval, _tick, idstring=TICKER_IDSTRING, persistent=False, bucket=interval
+        )
+    bucket.add(script)
+    _INTERVALS[script] = interval
+
+
+def unregister(script):
+    """
+    Remove a script from the scheduler (does nothing if it is not registered).
+
+    """
+    interval = _INTERVALS.pop(script, None)
+    if interval is None:
+        return
+    bucket = _BUCKETS.get(interval)
+    if bucket is None:
+        return
+    bucket.discard(script)
+    if not bucket:
+        del _BUCKETS[interval]
+        TICKER_HANDLER.remove(interval, _tick, idstring=TICKER_IDSTRING, persistent=False)
+
+
+def _tick(bucket=None, **kwargs):
+    """
+    Handle all scripts of one bucket. Called by the ticker.
+
+    """
+    # listener check only once per location and pass
+    listening = {}
+    for script in list(_BUCKETS.get(bucket, ())):
+        obj = script.obj
+        location = obj.location if obj else None
+        if not script.pk or location is None:
+            continue
+        if location not in listening:
+            listening[location] = has_listeners(location)
+        if not listening[location]:
+            continue
+        try:
+            script.at_repeat()
+        except Exception:
+            logger.log_trace(f"Error in ambient script {script}.")
@@ -0,0 +1,85 @@
+"""
+Burn Scheduler
+
+Fires (see `typeclasses.fires.Fire`) don't tick. A burning fire only stores
+the time it burns out (`burn_until`), computed from the fuel put into it. This
+module keeps all burn-out times in one priority queue and has a single
+reactor call pending for the earliest one, so idle fires cost nothing.
+
+Refuelling a fire just schedules it again. The old queue entry is then
+outdated (its time no longer equals `burn_until`) and skipped when it comes up.
+
+```python
+    from world import burn
+
+    fire.burn_until = time.time() + 600
+    burn.schedule(fire)
+```
+
+"""
+
+import heapq
+import itertools
+import time
+from evennia.utils import logger
+from evennia.utils.search import search_tag
+from twisted.internet import reactor
+
+# tag of burning fires, used to schedule them again after a server start
+BURNING_TAG = ("burning", "fire")
+
+# (burn_until, sequence number, fire)
+_QUEUE = []
+_SEQUENCE = itertools.count()
+# (time, IDelayedCall) of the pending reactor call
+_PENDING = None
+
+
+def schedule(fire):
+    """
+    Call `fire.burn_out()` at `fire.burn_until`.
+
+    """
+    heapq.heappush(_QUEUE, (fire.burn_until, next(_SEQUENCE), fire))
+    _reschedule()
+
+
+def resume():
+    """
+    Schedule all burning fires again. Called from `at_server_start`, fires that
+    burnt out while the server was down go out at once.
+
+    """
+    key, category = BURNING_TAG
+    for fire in search_tag(key, category=category):
+        schedule(fire)
+
+
+def _reschedule():
+    global _PENDING
+    if not _QUEUE:
+        return
+    due = _QUEUE[0][0]
+    if _PENDING:
+        pending_due, call = _PENDING
+        if pending_due <= due and call.active():
+            return
+        if call.active():
+            call.cancel()
+    _PENDING = (due, reactor.callLater(max(0, due - time.time()), _burn_out_due))
+
+
+def _burn_out_due():
+    global _PENDING
+    _PENDING = None
+    now = time.time()
+    while _QUEUE and _QUEUE[0][0] <= now:
+        burn_until, _, fire = heapq.heappop(_QUEUE)
+        if not fire.pk or fire.burn_until != burn_until:
+            # deleted or refuelled since
+            continue
+        try:
+            fire.burn_out()
+        except Exception:
+            logger.log_trace(f"Error burning out {fire}.")
+    _reschedule()
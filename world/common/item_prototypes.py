@@ -7,6 +7,7 @@ APFEL = {
     # "gender": "m",
     "desc": "Ein ganz normaler Apfel.",
     "weight": 0.1,
+    "stackable": True,
     "tags": [("apfel", "crafting_material"), ("m", "gender")],
 }
 
@@ -18,6 +19,7 @@ HOLZ = {
     "desc": "Ein Stück Holz.",
     "weight": 1,
     "fuel": 10 * 60,
+    "stackable": True,
     "tags": [("holz", "crafting_material")],
 }
 
@@ -29,6 +31,7 @@ GRAS = {
     "desc": "Ein Büschel Gras.",
     "weight": 0.1,
     "fuel": 2 * 60,
+    "stackable": True,
     "tags": [("gras", "crafting_material")],
 }
 
@@ -39,6 +42,7 @@ STEIN = {
     # "gender": "m",
     "desc": "Ein mittelgroßer Stein.",
     "weight": 4,
+    "stackable": True,
     "tags": [("stein", "crafting_material"), ("m", "gender")],
 }
 
@@ -50,6 +54,7 @@ HARTHOLZ = {
     "desc": "Diese seltene Art von Holz ist doppelt so hart wi gewöhnliches Holz und brennt länger.",
     "weight": 1.5,
     "fuel": 15 * 60,
+    "stackable": True,
     "tags": [("hartholz", "crafting_material")],
 }
 
@@ -59,6 +64,7 @@ GETROCKNETES_GRAS = {
     "desc": "Dieses Gras wurde einige Tage getrocknet.",
     "weight": 0.2,
     "fuel": 3 * 60,
+    "stackable": True,
     "tags": [("getrocknetes_gras", "crafting_material")],
 }
 
@@ -68,6 +74,7 @@ REET = {
     "desc": "Hohes, trockenes Gras. Lässt sich gut als Dachbelag verwenden.",
     "weight": 0.2,
     "fuel": 2 * 60,
+    "stackable": True,
     "tags": [("reet", "crafting_material")],
 }
 
@@ -78,6 +85,7 @@ LEHM = {
     "key": "Lehmklumpen",
     "aliases": ["Lehm"],
     "weight": 0.5,
+    "stackable": True,
     "tags": [("lehm", "crafting_material"), ("m", "gender")],
 }
 
@@ -87,6 +95,7 @@ FEUERHOLZ = {
     "desc": "Dieses (meistens gekaufte) Holz brennt lange und heiß.",
     "weight": 2,
     "fuel": 30 * 60,
+    "stackable": True,
     "tags": [("feuerholz", "crafting_material")],
 }
 
@@ -98,6 +107,7 @@ KOHLE = {
     "desc": "Dieser schwarze Klumpen lässt ein entzündetes Feuer viel länger und heißer brennen",
     "weight": 3,
     "fuel": 60 * 60,
+    "stackable": True,
     "tags": [("kohle", "crafting_material"), ("f", "gender")],
 }
 
@@ -106,6 +116,7 @@ LEDER = {
     "key": "Leder",
     "desc": "Das Leder fühlt sich zäh an. Es ist wertvoll und gut, um Kleidung daraus herzustellen.",
     "weight": 2,
+    "stackable": True,
     "tags": [("leder", "crafting_material")],
 }
 
@@ -114,6 +125,7 @@ ROBUSTES_LEDER = {
     "key": "Robustes Leder",
     "desc": "Dieses Leder ist selten, sehr robust und wertvoll.",
     "weight": 3,
+    "stackable": True,
     "tags": [("robustes_leder", "crafting_material")],
 }
 
@@ -123,6 +135,7 @@ FELL = {
     "plural": "Felle",
     "desc": "Es ist flauschig weich und sehr, sehr wertvoll. Eignet sich für schöne und gemütliche Kleidung.",
     "weight": 3.5,
+    "stackable": True,
     "tags": [("fell", "crafting_material")],
 }
 
@@ -132,6 +145,7 @@ STOFF = {
     "plural": "Stoffe",
     "desc": "Dieser Stoff fühlt sich rau an.",
     "weight": 0.5,
+    "stackable": True,
     "tags": [("stoff", "crafting_material"), ("m", "gender")],
 }
 
@@ -143,6 +157,7 @@ WEICHER_STOFF = {
     # "gender": "m",
     "desc": "Dieser Stoff ist weich. Er ist gut für Kleidung.",
     "weight": 0.75,
+    "stackable": True,
     "tags": [("weicher_stoff", "crafting_material"), ("m", "gender")],
 }
 
@@ -153,6 +168,7 @@ MAUERSTEIN = {
     # "gender": "m",
     "desc": "Ein großer, runder Stein, der gut für Mauern ist",
     "weight": 9,
+    "stackable": True,
     "tags": [("mauerstein", "crafting_material"), ("m", "gender")],
 }
 
@@ -163,6 +179,7 @@ ZIEGELSTEIN = {
     # "gender": "m",
     "desc": "Ein rechteckiger Stein. Gut für Mauern oder auch als Dachziegel nützlich.",
     "weight": 7,
+    "stackable": True,
     "tags": [("ziegelstein", "crafting_material"), ("m", "gender")],
 }
 
@@ -173,6 +190,7 @@ TIEFENSTEIN = {
     "plural": "Tiefensteine",
     "desc": "Ein kleiner, aber schwerer schwarzer Stein.",
     "weight": 10,
+    "stackable": True,
     "tags": [("tiefenstein", "crafting_material"), ("m", "gender")],
 }
 
@@ -183,6 +201,7 @@ EDELSTEIN = {
     "plural": "Edelsteine",
     "desc": "Dieser schöne Stein funkelt und glänzt im Licht. Er ist viel wert!",
     "weight": 7,
+    "stackable": True,
     "tags": [("edelstein", "crafting_material"), ("m", "gender")],
 }
 
@@ -193,6 +212,7 @@ MAGIESTEIN = {
     "plural": "Magiesteine",
     "desc": "Dieser orangefarbene Edelstein leuchtet im Dunkeln. Bei Berührungen zittert er stark. Er ist bei Händlern sehr begehrt, ist aber auch als Werkstoff wertvoll.",
     "weight": 5,
+    "stackable": True,
     "tags": [("magiestein", "crafting_material"), ("m", "gender")],
 }
 
@@ -203,6 +223,7 @@ MAGIESTEIN_2 = {
     "plural": "Magiesteine LV2",
     "desc": "Dieser violettfarbene Edelstein leuchtet für Magier hell, zittert in deren Händen und sie können ihn durch Wände sehen. In ihm befindet sich konzentrierte Magie",
     "weight": 6,
+    "stackable": True,
     "tags": [("magiestein_2", "crafting_material"), ("m", "gender")],
 }
 
@@ -214,6 +235,7 @@ DIAMANT = {
     "accusative": "Diamanten",
     "desc": "Dieser weiß-hellblaue Edelstein ist von unfassbarem Wert.",
     "weight": 10,
+    "stackable": True,
     "tags": [("diamant", "crafting_material"), ("m", "gender")],
 }
 
@@ -247,3 +269,14 @@ TRUHE = {
     "capacity": 10,
     "tags": [("f", "gender")],
 }
+
+# FIRES
+
+FEUERSTELLE = {
+    "typeclass": "typeclasses.fires.Fire",
+    "key": "Feuerstelle",
+    "desc": "Ein Ring aus Steinen um einen Haufen Asche. Hier lässt sich ein Feuer machen.",
+    "weight": 50,
+    "capacity": 10,
+    "tags": [("f", "gender")],
+}
@@ -0,0 +1,247 @@
+"""
+Crafting
+
+Recipes turn crafting materials (tag category "crafting_material") into new
+items. Tools (tag category "crafting_tool") are needed but not used up.
+
+A recipe is a dict:
+
+```python
+    {
+        "key": "Feuerholz",             # name used in the craft command
+        "materials": {"holz": 3},       # material tag -> units used up
+        "tools": ["feuerstein"],        # tool tags needed (optional)
+        "result": "feuerholz",          # prototype key of the result
+        "quantity": 1,                  # units created (optional)
+    }
+```
+
+`RecipeIndex` maps every material tag to the recipes using it. To find what
+can be crafted from an inventory only the recipes of the materials at hand are
+looked at: for each of them it is counted how many of its materials are
+available in the needed amount (multiset counting). Recipes where this count
+equals the number of their materials can be crafted.
+
+```python
+    from world.crafting import RECIPE_INDEX, craft
+
+    RECIPE_INDEX.craftable(character.contents)
+    craft(character, "Feuerholz")
+```
+
+"""
+
+from collections import Counter, defaultdict
+from django.db import transaction
+from world.enums import CraftingCategory
+from world.spawner import spawn_many
+
+RECIPES = [
+    {
+        "key": "Feuerholz",
+        "materials": {"holz": 3},
+        "result": "feuerholz",
+    },
+    {
+        "key": "Getrocknetes Gras",
+        "materials": {"gras": 2},
+        "result": "getrocknetes_gras",
+    },
+    {
+        "key": "Mauerstein",
+        "materials": {"stein": 3},
+        "result": "mauerstein",
+    },
+    {
+        "key": "Ziegelstein",
+        "materials": {"lehm": 2, "kohle": 1},
+        "tools": ["feuerstein"],
+        "result": "ziegelstein",
+    },
+    {
+        "key": "Robustes Leder",
+        "materials": {"leder": 2},
+        "result": "robustes_leder",
+    },
+    {
+        "key": "weicher Stoff",
+        "materials": {"stoff": 2},
+        "result": "weicher_stoff",
+    },
+    {
+        "key": "Magiestein LV2",
+        "materials": {"magiestein": 3},
+        "result": "magiestein_2",
+    },
+]
+
+
+def get_crafting_tags(obj, category):
+    """
+    Get the crafting tags of an object.
+
+    Args:
+        obj (Object): The object.
+        category (CraftingCategory): MATERIAL or TOOL.
+
+    Returns:
+        list: The tag keys.
+
+    """
+    return obj.tags.get(category=category.value, return_list=True)
+
+
+def count_materials(objs):
+    """
+    Count the units of each material in `objs`, taking stack quantities into account.
+
+    Returns:
+        Counter: material tag -> units
+
+    """
+    counts = Counter()
+    for obj in objs:
+        for tag in get_crafting_tags(obj, CraftingCategory.MATERIAL):
+            counts[tag] += getattr(obj, "quantity", 1)
+    return counts
+
+
+def collect_tools(objs):
+    """
+    Get the tool tags of all objects in `objs`.
+
+    """
+    tools = set()
+    for obj in objs:
+        tools.update(get_crafting_tags(obj, CraftingCategory.TOOL))
+    return tools
+
+
+class RecipeIndex:
+    """
+    Inverted index from material tags to recipes.
+
+    Args:
+        recipes (iterable): Recipe dicts (see module docstring).
+
+    """
+
+    def __init__(self, recipes=()):
+        # recipe key (lower case) -> recipe
+        self.recipes = {}
+        # material tag -> recipes using it
+        self.by_material = defaultdict(list)
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe):
+        self.recipes[recipe["key"].lower()] = recipe
+        for material in recipe["materials"]:
+            self.by_material[material].append(recipe)
+
+    def get(self, key):
+        """
+        Get a recipe by its key (case insensitive), None if there is none.
+
+        """
+        return self.recipes.get(key.strip().lower())
+
+    def craftable(self, objs):
+        """
+        Get the recipes that can be crafted with `objs` (e.g. an inventory).
+
+        Args:
+            objs (iterable): The available objects (materials and tools).
+
+        Returns:
+            list: The recipes.
+
+        """
+        objs = list(objs)
+        counts = count_materials(objs)
+        tools = collect_tools(objs)
+
+        # only recipes using the materials at hand are looked at
+        # recipe id -> number of its materials available in the needed amount
+        satisfied = Counter()
+        candidates = {}
+        for material, available in counts.items():
+            for recipe in self.by_material.get(material, ()):
+                if available >= recipe["materials"][material]:
+                    satisfied[id(recipe)] += 1
+                    candidates[id(recipe)] = recipe
+
+        return [
+            recipe
+            for recipe_id, recipe in candidates.items()
+            if satisfied[recipe_id] == len(recipe["materials"])
+            and tools.issuperset(recipe.get("tools", ()))
+        ]
+
+    def can_craft(self, recipe, objs):
+        """
+        Check if a single recipe can be crafted with `objs`.
+
+        """
+        objs = list(objs)
+        counts = count_materials(objs)
+        return all(
+            counts[material] >= needed for material, needed in recipe["materials"].items()
+        ) and collect_tools(objs).issuperset(recipe.get("tools", ()))
+
+
+RECIPE_INDEX = RecipeIndex(RECIPES)
+
+
+def consume_materials(crafter, materials):
+    """
+    Use up materials from the inventory of `crafter`, splitting stacks if needed.
+
+    Args:
+        crafter (Object): Whose inventory to use.
+        materials (dict): material tag -> units
+
+    """
+    for material, needed in materials.items():
+        for obj in list(crafter.contents):
+            if needed <= 0:
+                break
+            if material not in get_crafting_tags(obj, CraftingCategory.MATERIAL):
+                continue
+            quantity = getattr(obj, "quantity", 1)
+            if quantity > needed:
+                weight = obj.gross_weight
+                obj.quantity = quantity - needed
+                crafter.at_contents_change(changed=obj, weight_change=obj.gross_weight - weight)
+                needed = 0
+            else:
+                obj.delete()
+                needed -= quantity
+
+
+def craft(crafter, recipe):
+    """
+    Craft a recipe from the inventory of `crafter`. Using up the materials and
+    creating the result happen in one transaction.
+
+    Args:
+        crafter (Object): Who crafts. Materials and tools are taken from its inventory
+            and the result is put there.
+        recipe (dict or str): The recipe or its key.
+
+    Returns:
+        list: The created objects, empty if the recipe is unknown or can't be crafted.
+
+    """
+    if isinstance(recipe, str):
+        recipe = RECIPE_INDEX.get(recipe)
+    if not recipe or not RECIPE_INDEX.can_craft(recipe, crafter.contents):
+        return []
+
+    with transaction.atomic():
+        consume_materials(crafter, recipe["materials"])
+        # stackable results are created as one stack
+        results = spawn_many(recipe["result"], recipe.get("quantity", 1), crafter)
+
+    # merge with stacks already in the inventory
+    return [obj.join_stack() if hasattr(obj, "join_stack") else obj for obj in results]
@@ -0,0 +1,146 @@
+"""
+Declension
+
+German article and number tables used by `ObjectParent.get_numbered_name`.
+
+The tables are built once at import time, so rendering a numbered name is
+only a couple of dictionary lookups.
+
+```python
+    from world.declension import numbered_article
+
+    numbered_article(3, "accusative", "m")                    # -> "drei"
+    numbered_article(1, "accusative", "m")                    # -> "einen"
+    numbered_article(2, "dative", "f", definite=True)         # -> "den zwei"
+```
+
+"""
+
+CASES = ("nominative", "accusative", "dative", "genitive")
+GENDERS = ("m", "f", "n")
+
+# case -> gender ("pl" for plural) -> article type -> article
+ARTICLES = {
+    "nominative": {
+        "m": {"indef": "ein", "def": "der"},
+        "f": {"indef": "eine", "def": "die"},
+        "n": {"indef": "ein", "def": "das"},
+        "pl": {"indef": "", "def": "die "},
+    },
+    "accusative": {
+        "m": {"indef": "einen", "def": "den"},
+        "f": {"indef": "eine", "def": "die"},
+        "n": {"indef": "ein", "def": "das"},
+        "pl": {"indef": "", "def": "die "},
+    },
+    "dative": {
+        "m": {"indef": "einem", "def": "dem"},
+        "f": {"indef": "einer", "def": "der"},
+        "n": {"indef": "einem", "def": "dem"},
+        "pl": {"indef": "", "def": "den "},
+    },
+    "genitive": {
+        "m": {"indef": "eines", "def": "des"},
+        "f": {"indef": "einer", "def": "der"},
+        "n": {"indef": "eines", "def": "des"},
+        "pl": {"indef": "", "def": "der "},
+    },
+}
+
+NUMERALS = {
+    2: "zwei",
+    3: "drei",
+    4: "vier",
+    5: "fünf",
+    6: "sechs",
+    7: "sieben",
+    8: "acht",
+    9: "neun",
+    10: "zehn",
+    11: "elf",
+    12: "zwölf",
+}
+
+# every article word, e.g. to leave them out of word indexes ("die" would match everything)
+ARTICLE_WORDS = frozenset(
+    word
+    for genders in ARTICLES.values()
+    for article_types in genders.values()
+    for article in article_types.values()
+    for word in article.split()
+)
+
+# (case, gender, article_type) -> singular article, with fallbacks already resolved
+_SINGULAR = {
+    (case, gender, article_type): ARTICLES[case][gender][article_type]
+    for case in CASES
+    for gender in GENDERS
+    for article_type in ("indef", "def")
+}
+
+# (case, article_type) -> plural article prefix
+_PLURAL = {
+    (case, article_type): ARTICLES[case]["pl"][article_type]
+    for case in CASES
+    for article_type in ("indef", "def")
+}
+
+
+def singular_article(case, gender, definite=False):
+    """
+    Get the singular article for a noun.
+
+    Args:
+        case (str): One of `CASES`. Unknown cases fall back to "nominative".
+        gender (str): One of `GENDERS`. Unknown genders fall back to "n".
+        definite (bool): Definite ("der") instead of indefinite ("ein") article.
+
+    Returns:
+        str: The article, e.g. "einen".
+
+    """
+    article_type = "def" if definite else "indef"
+    article = _SINGULAR.get((case, gender, article_type))
+    if article is None:
+        if case not in ARTICLES:
+            case = "nominative"
+        if gender not in GENDERS:
+            gender = "n"
+        article = _SINGULAR[(case, gender, article_type)]
+    return article
+
+
+def plural_article(case, definite=False):
+    """
+    Get the plural article for a noun without a number ("die", or "" if indefinite).
+
+    """
+    article_type = "def" if definite else "indef"
+    prefix = _PLURAL.get((case, article_type))
+    if prefix is None:
+        prefix = _PLURAL[("nominative", article_type)]
+    return prefix.strip()
+
+
+def numbered_article(count, case, gender, definite=False):
+    """
+    Get the article (and number word) put in front of a noun for a given count.
+
+    Args:
+        count (int): Number of things.
+        case (str): Grammatical case, see `singular_article`.
+        gender (str): Grammatical gender, see `singular_article`.
+        definite (bool): Use definite articles.
+
+    Returns:
+        str: The article for `count == 1` ("ein"), else the plural article plus
+            the number ("die zwei", "drei", "42").
+
+    """
+    if count == 1:
+        return singular_article(case, gender, definite)
+    article_type = "def" if definite else "indef"
+    prefix = _PLURAL.get((case, article_type))
+    if prefix is None:
+        prefix = _PLURAL[("nominative", article_type)]
+    return f"{prefix}{NUMERALS.get(count, count)}"
@@ -0,0 +1,101 @@
+"""
+Gold Ledger
+
+All gold changes go through this module. A transfer moves gold from one
+character to another, `None` as sender or receiver stands for the world (gold
+found, paid to a merchant NPC without a purse, ...).
+
+- `transfer` applies a single transfer.
+- `settle` applies many transfers in one database transaction. Either all of
+  them are applied or none (if a balance would become negative).
+
+Every character is written once per settlement and notified once with its net
+change (`at_pot_gold_change`). Applied transfers are appended to the journal
+`server/logs/gold_ledger.log` after the transaction is committed.
+
+```python
+    from world import gold_ledger
+
+    gold_ledger.transfer(buyer, seller, 12, reason="Kessel")
+    gold_ledger.settle([(None, char, 5) for char in party], reason="Beute")
+```
+
+"""
+
+from functools import partial
+from django.db import transaction
+from evennia.utils import logger
+
+JOURNAL_FILE = "gold_ledger.log"
+
+
+def _journal_ref(obj):
+    return "-" if obj is None else f"#{obj.id} {obj.key}"
+
+
+def _write_journal(transfers, reason):
+    for sender, receiver, amount in transfers:
+        logger.log_file(
+            f"{_journal_ref(sender)} -> {_journal_ref(receiver)}: {amount} ({reason})",
+            filename=JOURNAL_FILE,
+        )
+
+
+def settle(transfers, reason="", notify=True):
+    """
+    Apply several gold transfers in one transaction, all or nothing.
+
+    Args:
+        transfers (iterable): `(sender, receiver, amount)` tuples. `sender` or
+            `receiver` may be None (the world). `amount` must not be negative.
+        reason (str): Reason written to the journal.
+        notify (bool): Call `at_pot_gold_change` with the net change of each character.
+
+    Returns:
+        bool: True if the transfers were applied, False if a balance would become
+            negative or an amount is negative (nothing is changed then).
+
+    """
+    transfers = [(sender, receiver, int(amount)) for sender, receiver, amount in transfers]
+
+    # net change per character, so each one is written once
+    deltas = {}
+    for sender, receiver, amount in transfers:
+        if amount < 0:
+            return False
+        if sender is not None:
+            deltas[sender] = deltas.get(sender, 0) - amount
+        if receiver is not None:
+            deltas[receiver] = deltas.get(receiver, 0) + amount
+    deltas = {char: delta for char, delta in deltas.items() if delta}
+
+    # check and write in one go, nothing else can change the balances in between
+    with transaction.atomic():
+        if any(char.gold + delta < 0 for char, delta in deltas.items()):
+            return False
+        for char, delta in deltas.items():
+            char.gold += delta
+        transaction.on_commit(partial(_write_journal, transfers, reason))
+
+    if notify:
+        for char, delta in deltas.items():
+            char.at_pot_gold_change(delta)
+    return True
+
+
+def transfer(sender, receiver, amount, reason="", notify=True):
+    """
+    Move gold from `sender` to `receiver`.
+
+    Args:
+        sender (Object or None): Who pays, None for the world.
+        receiver (Object or None): Who gets the gold, None for the world.
+        amount (int): Amount of gold, not negative.
+        reason (str): Reason written to the journal.
+        notify (bool): Call `at_pot_gold_change` on sender and receiver.
+
+    Returns:
+        bool: True if the gold was moved.
+
+    """
+    return settle([(sender, receiver, amount)], reason=reason, notify=notify)
@@ -31,8 +31,17 @@ module:
     caller.msg(prompt=health_bar)
 ```
 
+Rendered bars are cached by their text and fill state, so redrawing the same
+bar (e.g. on every prompt update) is a dictionary lookup. Use `display_meters`
+to render several bars at once.
+
 """
 
+from functools import lru_cache
+
+# maximum number of different bars kept by the render cache
+METER_CACHE_SIZE = 1024
+
 
 def display_meter(
     cur_value,
@@ -84,19 +93,9 @@ def display_meter(
     if show_values:
         num_text = "%i/%i" % (cur_value, max_value)
     bar_base_str = pre_text + num_text + post_text
-    # # Cut down the length of the base string if needed
-    # if len(bar_base_str) > length:
-    #     bar_base_str = bar_base_str[:length]
     # grow length of the bar if base string is too long
     if len(bar_base_str) > length:
         length = len(bar_base_str)
-    # Pad and align the bar base string
-    if align == "right":
-        bar_base_str = bar_base_str.rjust(length, " ")
-    elif align == "center":
-        bar_base_str = bar_base_str.center(length, " ")
-    else:
-        bar_base_str = bar_base_str.ljust(length, " ")
 
     if max_value < 1:  # Prevent divide by zero
         max_value = 1
@@ -107,20 +106,54 @@ def display_meter(
 
     # Now it's time to determine where to put the color codes.
     percent_full = float(cur_value) / float(max_value)
-    split_index = round(float(length) * percent_full)
     # Determine point at which to split the bar
-    split_index = int(split_index)
-
-    # Separate the bar string into full and empty portions
-    full_portion = bar_base_str[:split_index]
-    empty_portion = bar_base_str[split_index:]
+    split_index = int(round(float(length) * percent_full))
 
     # Pick which fill color to use based on how full the bar is
     fillcolor_index = float(len(fill_color)) * percent_full
     fillcolor_index = max(0, int(round(fillcolor_index)) - 1)
-    fillcolor_code = "|[" + fill_color[fillcolor_index]
 
-    # Make color codes for empty bar portion and text_color
+    # the bar only depends on this quantized state, so it can be cached
+    return _render_meter(
+        bar_base_str, length, align, split_index, fill_color[fillcolor_index], empty_color, text_color
+    )
+
+
+def display_meters(values, **kwargs):
+    """
+    Render several meters at once, e.g. for all characters in a room.
+
+    Args:
+        values (iterable): `(cur_value, max_value)` pairs.
+        **kwargs: Keyword arguments of `display_meter`, the same for all meters.
+
+    Returns:
+        list: The display bars, in the order of `values`.
+
+    """
+    return [display_meter(cur_value, max_value, **kwargs) for cur_value, max_value in values]
+
+
+@lru_cache(maxsize=METER_CACHE_SIZE)
+def _render_meter(bar_base_str, length, align, split_index, fill_color, empty_color, text_color):
+    """
+    Assemble the bar string. Cached, see `display_meter`.
+
+    """
+    # Pad and align the bar base string
+    if align == "right":
+        bar_base_str = bar_base_str.rjust(length, " ")
+    elif align == "center":
+        bar_base_str = bar_base_str.center(length, " ")
+    else:
+        bar_base_str = bar_base_str.ljust(length, " ")
+
+    # Separate the bar string into full and empty portions
+    full_portion = bar_base_str[:split_index]
+    empty_portion = bar_base_str[split_index:]
+
+    # Make color codes for fill, empty bar portion and text_color
+    fillcolor_code = "|[" + fill_color
     emptycolor_code = "|[" + empty_color
     textcolor_code = "|" + text_color
 
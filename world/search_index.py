@@ -0,0 +1,217 @@
+"""
+Search Index
+
+In-memory index of the names of objects, used for local searches (the contents
+of a location, see `ObjectParent.get_search_index`) so they don't need SQL.
+
+An object is indexed by its key, its aliases, its plural and its key with all
+German articles ("einen Stein", "die Steine", ...). Lookups are case
+insensitive and try, in this order:
+
+- exact: the whole name matches
+- prefix: every word of the search string is the start of a word of the name
+  ("gr st" matches "großer Stein"). Articles are left out on both sides, so
+  "die" alone does not match every plural and "den st" matches "Stein".
+
+There is no typo tolerance: a name that is close to another ("Stern",
+"Stein") must not act on an object the player never named.
+
+```python
+    from world.search_index import SearchIndex
+
+    index = SearchIndex(location.contents)
+    index.match("einen stein")
+```
+
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from django.conf import settings
+from world.declension import ARTICLE_WORDS, CASES, plural_article, singular_article
+
+# "2-stein": the second of several matches, see `split_match_number`
+_MULTIMATCH_REGEX = re.compile(settings.SEARCH_MULTIMATCH_REGEX, re.I + re.U)
+
+
+def normalize(name):
+    """
+    Normalize a name or search string for the index (lower case, single spaces).
+
+    """
+    return " ".join(str(name).lower().split())
+
+
+def split_match_number(searchdata):
+    """
+    Split the match number off a search string, like Evennia's `search_object`
+    does for `settings.SEARCH_MULTIMATCH_REGEX` ("2-stein").
+
+    Args:
+        searchdata (str): The search string.
+
+    Returns:
+        tuple: `(index, searchdata)`. `index` is the 0-based position of the
+            wanted match, None if no number was given.
+
+    """
+    match = _MULTIMATCH_REGEX.match(searchdata)
+    if not match:
+        return None, searchdata
+    return int(match.group("number")) - 1, match.group("name")
+
+
+def _name_words(name):
+    """
+    Words of a normalized name for the word index, without articles (unless the
+    name is made of nothing else).
+
+    """
+    words = name.split()
+    return [word for word in words if word not in ARTICLE_WORDS] or words
+
+
+def index_names(obj):
+    """
+    Get all normalized names an object can be found by.
+
+    Args:
+        obj (DefaultObject): The object.
+
+    Returns:
+        set: The names.
+
+    """
+    key = obj.key
+    names = {key, *obj.aliases.all()}
+    if hasattr(obj, "get_noun_forms"):
+        gender, plural, accusative = obj.get_noun_forms()
+        plural = plural or key
+        singulars = {key, accusative} - {None}
+        names.add(plural)
+        for case in CASES:
+            for definite in (False, True):
+                article = singular_article(case, gender, definite)
+                names.update(f"{article} {singular}" for singular in singulars)
+            names.add(f"{plural_article(case, definite=True)} {plural}")
+    return {normalize(name) for name in names}
+
+
+class SearchIndex:
+    """
+    Maps normalized names to objects.
+
+    Args:
+        objs (iterable, optional): Objects to index.
+
+    """
+
+    def __init__(self, objs=()):
+        # name -> objects
+        self.names = defaultdict(list)
+        # word -> names containing it
+        self.words = defaultdict(set)
+        # object -> its indexed names
+        self.objects = {}
+        self._sorted_words = None
+        for obj in objs:
+            self.add(obj)
+
+    def __contains__(self, obj):
+        return obj in self.objects
+
+    def add(self, obj):
+        """
+        Index an object (again, if it was already indexed).
+
+        """
+        if obj in self.objects:
+            self.remove(obj)
+        names = index_names(obj)
+        self.objects[obj] = names
+        for name in names:
+            self.names[name].append(obj)
+            for word in _name_words(name):
+                self.words[word].add(name)
+        self._sorted_words = None
+
+    def remove(self, obj):
+        """
+        Remove an object from the index.
+
+        """
+        names = self.objects.pop(obj, None)
+        if not names:
+            return
+        for name in names:
+            objs = self.names[name]
+            objs.remove(obj)
+            if objs:
+                continue
+            del self.names[name]
+            for word in _name_words(name):
+                self.words[word].discard(name)
+                if not self.words[word]:
+                    del self.words[word]
+        self._sorted_words = None
+
+    def exact(self, searchdata):
+        """
+        Objects with a name equal to `searchdata`.
+
+        """
+        return list(self.names.get(normalize(searchdata), ()))
+
+    def prefix(self, searchdata):
+        """
+        Objects with a name where every word of `searchdata` starts a word of the name.
+
+        """
+        query_words = [
+            word for word in normalize(searchdata).split() if word not in ARTICLE_WORDS
+        ]
+        if not query_words:
+            return []
+        if self._sorted_words is None:
+            self._sorted_words = sorted(self.words)
+        sorted_words = self._sorted_words
+
+        names = None
+        for query_word in query_words:
+            word_names = set()
+            pos = bisect_left(sorted_words, query_word)
+            while pos < len(sorted_words) and sorted_words[pos].startswith(query_word):
+                word_names.update(self.words[sorted_words[pos]])
+                pos += 1
+            names = word_names if names is None else names & word_names
+            if not names:
+                return []
+        return self._objects_for(names)
+
+    def match(self, searchdata, exact=False):
+        """
+        Find objects by name: exact matches, else prefix matches.
+
+        Args:
+            searchdata (str): The search string.
+            exact (bool): Only return exact matches.
+
+        Returns:
+            list: The matching objects (may be empty).
+
+        """
+        results = self.exact(searchdata)
+        if results or exact:
+            return results
+        return self.prefix(searchdata)
+
+    def _objects_for(self, names):
+        results = []
+        seen = set()
+        for name in names:
+            for obj in self.names.get(name, ()):
+                if obj not in seen:
+                    seen.add(obj)
+                    results.append(obj)
+        return results
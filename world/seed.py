@@ -0,0 +1,176 @@
+"""
+World Seed
+
+Builds the world from a data file (`world/seed.json`) instead of `dig` and
+`spawn` by hand. The file lists rooms, exits between them and prototype
+placements:
+
+```json
+    {
+        "rooms": [
+            {"id": "markt", "key": "Marktplatz", "desc": "..."}
+        ],
+        "exits": [
+            {"id": "markt_nord", "key": "Norden", "aliases": ["n"],
+             "from": "markt", "to": "#2"}
+        ],
+        "objects": [
+            {"id": "markt_truhe", "prototype": "truhe", "location": "markt", "count": 1}
+        ]
+    }
+```
+
+Rooms are referenced by their `id` or by a dbref ("#2" is Limbo). Everything
+is created in one transaction, rooms first, then exits, then objects. Every
+created object is tagged with its `id` (category "world_seed", ids are not
+case sensitive). Running the seed again only applies the difference: missing
+rooms, exits and objects are created, changed names, descriptions and exit
+destinations are updated.
+
+Called from `at_initial_setup` and by the `@seed` command.
+
+"""
+
+import json
+import os
+from django.conf import settings
+from django.db import transaction
+from evennia.objects.models import ObjectDB
+from evennia.utils.create import create_object
+from world.spawner import spawn_many
+
+SEED_CATEGORY = "world_seed"
+SEED_FILE = os.path.join(os.path.dirname(__file__), "seed.json")
+
+
+def load_seed(path=SEED_FILE):
+    """
+    Read a seed data file.
+
+    """
+    with open(path, encoding="utf-8") as seed_file:
+        return json.load(seed_file)
+
+
+def _seeded_objects():
+    """
+    Get all objects created by a seed: seed id -> objects.
+
+    """
+    # two queries for all of them: (tag key, object id) pairs, then the objects
+    rows = list(
+        ObjectDB.objects.filter(db_tags__db_category=SEED_CATEGORY).values_list(
+            "db_tags__db_key", "id"
+        )
+    )
+    objs = ObjectDB.objects.in_bulk({obj_id for _, obj_id in rows})
+    seeded = {}
+    for seed_id, obj_id in rows:
+        seeded.setdefault(seed_id, []).append(objs[obj_id])
+    return seeded
+
+
+def _update(obj, entry, stats):
+    """
+    Apply changed key and description of an existing seeded object.
+
+    """
+    changed = False
+    if entry.get("key") and obj.key != entry["key"]:
+        old_key = obj.key
+        obj.key = entry["key"]
+        # as with the name command: drops the old noun forms and tells the location
+        if hasattr(obj, "at_rename"):
+            obj.at_rename(old_key, obj.key)
+        changed = True
+    if "desc" in entry and obj.db.desc != entry["desc"]:
+        obj.db.desc = entry["desc"]
+        changed = True
+    if changed:
+        stats["updated"] += 1
+
+
+def seed_world(data=None):
+    """
+    Create (or update) the world from seed data.
+
+    Args:
+        data (dict, optional): Seed data, read from `SEED_FILE` if not given.
+
+    Returns:
+        dict: `{"created": int, "updated": int}`
+
+    Raises:
+        KeyError: If an exit or object refers to an unknown room.
+
+    """
+    if data is None:
+        data = load_seed()
+    stats = {"created": 0, "updated": 0}
+
+    with transaction.atomic():
+        seeded = _seeded_objects()
+        rooms = {}
+
+        def resolve(ref):
+            if ref.lower() in rooms:
+                return rooms[ref.lower()]
+            if ref.startswith("#") and ref[1:].isdigit():
+                room = ObjectDB.objects.filter(id=int(ref[1:])).first()
+                if room:
+                    return room
+            raise KeyError(f"Unknown room '{ref}' in world seed.")
+
+        # rooms first, exits and objects need them
+        for entry in data.get("rooms", ()):
+            seed_id = entry["id"].lower()
+            existing = seeded.get(seed_id)
+            if existing:
+                rooms[seed_id] = existing[0]
+                _update(existing[0], entry, stats)
+                continue
+            rooms[seed_id] = create_object(
+                entry.get("typeclass", settings.BASE_ROOM_TYPECLASS),
+                key=entry["key"],
+                aliases=entry.get("aliases"),
+                attributes=[("desc", entry["desc"])] if "desc" in entry else None,
+                tags=[(seed_id, SEED_CATEGORY)],
+                nohome=True,
+            )
+            stats["created"] += 1
+
+        for entry in data.get("exits", ()):
+            seed_id = entry["id"].lower()
+            location = resolve(entry["from"])
+            destination = resolve(entry["to"])
+            existing = seeded.get(seed_id)
+            if existing:
+                exi = existing[0]
+                _update(exi, entry, stats)
+                if exi.destination != destination:
+                    # also re-keys the exit index of the location
+                    exi.destination = destination
+                    stats["updated"] += 1
+                continue
+            create_object(
+                entry.get("typeclass", settings.BASE_EXIT_TYPECLASS),
+                key=entry["key"],
+                location=location,
+                destination=destination,
+                aliases=entry.get("aliases"),
+                tags=[(seed_id, SEED_CATEGORY)],
+            )
+            stats["created"] += 1
+
+        for entry in data.get("objects", ()):
+            seed_id = entry["id"].lower()
+            location = resolve(entry["location"])
+            # only spawn the units missing in this location, units that were
+            # carried away don't count
+            existing = [obj for obj in seeded.get(seed_id, ()) if obj.location == location]
+            missing = entry.get("count", 1) - sum(getattr(obj, "quantity", 1) for obj in existing)
+            for obj in spawn_many(entry["prototype"], missing, location):
+                obj.tags.add(seed_id, category=SEED_CATEGORY)
+                stats["created"] += 1
+
+    return stats
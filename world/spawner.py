@@ -0,0 +1,213 @@
+"""
+Spawner
+
+Compiled prototypes for fast spawning. Evennia's `spawn` looks up, flattens
+and validates a prototype (parents, typeclass, tags, attributes) every time it
+is called. Here every module prototype (see `world/prototypes.py`) is compiled
+once, at server start, into an immutable `SpawnPlan`: flattened, with the
+typeclass checked and tags and attributes normalized to tuples. `spawn_many`
+creates objects from the plan.
+
+```python
+    from world.spawner import spawn_many
+
+    spawn_many("holz", 50, character)      # one stack of 50 Holz
+    spawn_many("truhe", 3, room)           # three chests
+```
+
+Prototypes using protfuncs (`$func(...)` values, evaluated per spawn) are not
+compiled, `spawn_many` uses Evennia's `spawn` for them.
+
+"""
+
+from typing import NamedTuple
+from django.conf import settings
+from django.db import transaction
+from evennia.prototypes import prototypes as protlib
+from evennia.prototypes.spawner import batch_create_object, flatten_prototype, spawn
+from evennia.utils import logger
+from evennia.utils.utils import class_from_module, make_iter
+import world.prototypes
+
+
+class SpawnPlan(NamedTuple):
+    prototype_key: str
+    typeclass_path: str
+    key: str
+    aliases: tuple
+    locks: str
+    permissions: tuple
+    # (key, value, category, lockstring)
+    attrs: tuple
+    # (key, category, data)
+    tags: tuple
+    stackable: bool
+
+
+# prototype key -> SpawnPlan, None if the prototype can't be compiled
+_PLANS: dict[str, SpawnPlan | None] = {}
+
+
+def _normalize_attr(attr):
+    key, value, category, lockstring = (tuple(attr) + (None, None, ""))[:4]
+    return (key, value, category, lockstring or "")
+
+
+def _normalize_tag(tag):
+    tag = make_iter(tag)
+    key, category, data = (tuple(tag) + (None, None))[:3]
+    return (key, category, data)
+
+
+def _uses_protfuncs(value):
+    if isinstance(value, str):
+        return "$" in value
+    if isinstance(value, (list, tuple)):
+        return any(_uses_protfuncs(item) for item in value)
+    if isinstance(value, dict):
+        return any(_uses_protfuncs(item) for item in value.values())
+    return False
+
+
+def compile_prototype(prototype_key):
+    """
+    Flatten and validate a prototype into a spawn plan.
+
+    Args:
+        prototype_key (str): Key of the prototype.
+
+    Returns:
+        SpawnPlan or None: The plan, None if the prototype uses protfuncs.
+
+    Raises:
+        KeyError: If there is no such prototype.
+
+    """
+    found = protlib.search_prototype(key=prototype_key, require_single=True)
+    if not found:
+        raise KeyError(prototype_key)
+    prototype = flatten_prototype(found[0], validate=True)
+    if _uses_protfuncs(prototype):
+        return None
+
+    typeclass_path = prototype.get("typeclass") or settings.BASE_OBJECT_TYPECLASS
+    # fails early for broken typeclass paths
+    typeclass = class_from_module(typeclass_path)
+
+    attrs = tuple(_normalize_attr(attr) for attr in prototype.get("attrs", ()))
+    tags = tuple(_normalize_tag(tag) for tag in make_iter(prototype.get("tags", ())))
+    tags += ((prototype_key.lower(), "from_prototype", None),)
+    # the obj_type tags come with the other tags (`Object.add_obj_type_tags` skips them)
+    present = {(str(key).lower(), category) for key, category, _ in tags}
+    tags += tuple(
+        (obj_type.value.lower(), "obj_type", None)
+        for obj_type in getattr(typeclass, "obj_type", ())
+        if (obj_type.value.lower(), "obj_type") not in present
+    )
+
+    return SpawnPlan(
+        prototype_key=prototype_key.lower(),
+        typeclass_path=typeclass_path,
+        key=prototype.get("key") or prototype_key,
+        aliases=tuple(make_iter(prototype.get("aliases", ()))),
+        locks=prototype.get("locks", ""),
+        permissions=tuple(make_iter(prototype.get("permissions", ()))),
+        attrs=attrs,
+        tags=tags,
+        stackable=any(key == "stackable" and value for key, value, _, _ in attrs),
+    )
+
+
+def get_spawn_plan(prototype_key):
+    """
+    Get the compiled plan of a prototype, compiling it on first use.
+
+    Returns:
+        SpawnPlan or None: The plan, None if the prototype uses protfuncs, is
+            unknown or invalid. Failures are cached as well, so they are not
+            looked up again on every call.
+
+    """
+    prototype_key = prototype_key.lower()
+    try:
+        return _PLANS[prototype_key]
+    except KeyError:
+        pass
+    try:
+        plan = compile_prototype(prototype_key)
+    except (KeyError, protlib.ValidationError):
+        plan = None
+    _PLANS[prototype_key] = plan
+    return plan
+
+
+def compile_prototypes():
+    """
+    Compile all module prototypes. Called from `at_server_start`.
+
+    Returns:
+        int: Number of compiled prototypes.
+
+    """
+    _PLANS.clear()
+    for name, value in vars(world.prototypes).items():
+        if name.isupper() and isinstance(value, dict):
+            try:
+                get_spawn_plan(name)
+            except Exception:
+                logger.log_trace(f"Could not compile prototype {name}.")
+    return sum(1 for plan in _PLANS.values() if plan)
+
+
+def _objparams(plan, location, quantity=None):
+    """
+    The parameters of `batch_create_object` for one object.
+
+    """
+    attrs = list(plan.attrs)
+    if quantity is not None:
+        attrs.append(("quantity", quantity, None, ""))
+    create_kwargs = {
+        "db_key": plan.key,
+        "db_typeclass_path": plan.typeclass_path,
+        "db_location": location,
+        "db_home": location,
+    }
+    return (
+        create_kwargs,
+        list(plan.permissions),
+        plan.locks,
+        list(plan.aliases),
+        [],
+        attrs,
+        list(plan.tags),
+        [],
+    )
+
+
+def spawn_many(prototype_key, count, location=None):
+    """
+    Spawn `count` objects of a prototype in one transaction. Stackable prototypes
+    are spawned as a single stack with a quantity of `count`.
+
+    Args:
+        prototype_key (str): Key of the prototype.
+        count (int): Number of objects (units).
+        location (Object, optional): Where to put the objects.
+
+    Returns:
+        list: The new objects.
+
+    """
+    if count < 1:
+        return []
+    plan = get_spawn_plan(prototype_key)
+    if plan is None:
+        prototype = {"prototype_parent": prototype_key, "location": location}
+        with transaction.atomic():
+            return spawn(*[prototype] * count)
+
+    with transaction.atomic():
+        if plan.stackable:
+            return batch_create_object(_objparams(plan, location, quantity=count))
+        return batch_create_object(*(_objparams(plan, location) for _ in range(count)))
@@ -0,0 +1,173 @@
+"""
+Stat Store
+
+Write-behind buffer for hot numeric stats (hp, xp, ...). A
+`BufferedAttributeProperty` works like an `AttributeProperty`, but setting it
+only keeps the new value in memory. Dirty values are written to the database
+in batches by `flush_stats` - every `FLUSH_INTERVAL` seconds (see
+`start_flush_timer`, started in `at_server_start`) and when the server stops or
+reloads.
+
+A `DurableAttributeProperty` (used for gold) is written at once. It first
+flushes the pending stats of the same object in the same transaction, so a
+stored gold change is never ahead of earlier stat changes.
+
+```python
+    from world.statstore import BufferedAttributeProperty
+
+    class Character(DefaultCharacter):
+        hp = BufferedAttributeProperty(default=1)
+```
+
+Note that the buffered value is only seen through the property: `obj.db.hp`
+or `obj.attributes.get("hp")` return the last flushed value. Writing the
+Attribute directly (`obj.db.hp = 5`, `@set`) drops the buffered value, see
+`discard_pending`.
+
+"""
+
+from django.db import transaction
+from evennia.typeclasses.attributes import AttributeProperty
+from evennia.utils import logger
+from twisted.internet import task
+
+# seconds between two flushes of the dirty stats
+FLUSH_INTERVAL = 10
+
+# object -> {attribute key: (property, value)} of values not yet written
+_DIRTY = {}
+
+_FLUSH_TIMER = None
+
+
+class BufferedAttributeProperty(AttributeProperty):
+    """
+    AttributeProperty whose writes are kept in memory and flushed in batches.
+
+    """
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        pending = _DIRTY.get(instance)
+        if pending and self._key in pending:
+            return pending[self._key][1]
+        return super().__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        _DIRTY.setdefault(instance, {})[self._key] = (self, value)
+
+    def __delete__(self, instance):
+        pending = _DIRTY.get(instance)
+        if pending:
+            pending.pop(self._key, None)
+        super().__delete__(instance)
+
+    def write(self, instance, value):
+        """
+        Write a value to the database (bypassing the buffer).
+
+        """
+        super().__set__(instance, value)
+
+
+class DurableAttributeProperty(AttributeProperty):
+    """
+    AttributeProperty that is written at once, together with the pending
+    buffered stats of the object.
+
+    """
+
+    def __set__(self, instance, value):
+        with transaction.atomic():
+            _flush_object(instance)
+            super().__set__(instance, value)
+
+
+def _flush_object(instance):
+    pending = _DIRTY.pop(instance, None)
+    if not pending or not instance.pk:
+        # nothing to write or the object was deleted
+        return 0
+    for prop, value in pending.values():
+        prop.write(instance, value)
+    return len(pending)
+
+
+def flush_stats(obj=None):
+    """
+    Write dirty stats to the database in one transaction.
+
+    Args:
+        obj (Object, optional): Only flush the stats of this object.
+
+    Returns:
+        int: Number of attributes written.
+
+    """
+    with transaction.atomic():
+        if obj is not None:
+            return _flush_object(obj)
+        return sum(_flush_object(instance) for instance in list(_DIRTY))
+
+
+def discard_pending(obj, key=None, category=None):
+    """
+    Forget buffered values of `obj` whose Attribute was written directly (e.g.
+    by `@set`), so the property neither returns nor flushes the old value.
+    Called by `ObjectParent.at_attribute_change`.
+
+    Args:
+        obj (Object): The object.
+        key (str, optional): Key of the written Attribute, None for all.
+        category (str, optional): Category of the written Attribute.
+
+    """
+    pending = _DIRTY.get(obj)
+    if not pending:
+        return
+    for attr_key, (prop, _) in list(pending.items()):
+        if (key is None or attr_key == key) and prop._category == category:
+            del pending[attr_key]
+    if not pending:
+        _DIRTY.pop(obj, None)
+
+
+def pending_stats():
+    """
+    Get the number of attributes not yet written to the database.
+
+    """
+    return sum(len(pending) for pending in _DIRTY.values())
+
+
+def _flush_tick():
+    # errors must not stop the LoopingCall
+    try:
+        flush_stats()
+    except Exception:
+        logger.log_trace("Error flushing buffered stats.")
+
+
+def start_flush_timer(interval=FLUSH_INTERVAL):
+    """
+    Start flushing the dirty stats every `interval` seconds. Called from `at_server_start`.
+
+    """
+    global _FLUSH_TIMER
+    if _FLUSH_TIMER and _FLUSH_TIMER.running:
+        return
+    _FLUSH_TIMER = task.LoopingCall(_flush_tick)
+    _FLUSH_TIMER.start(interval, now=False)
+
+
+def stop_flush_timer():
+    """
+    Stop the flush timer and write all dirty stats. Called from `at_server_stop`.
+
+    """
+    global _FLUSH_TIMER
+    if _FLUSH_TIMER and _FLUSH_TIMER.running:
+        _FLUSH_TIMER.stop()
+    _FLUSH_TIMER = None
+    flush_stats()